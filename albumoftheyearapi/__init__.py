@@ -1,5 +1,13 @@
 """ Used for PyTest """
 
-from .client import AOTY
+from .album import PageLimitError
+from .client import AOTY, AsyncAOTY
+from .session import disable_page_cache, enable_page_cache
 
-__all__ = ["AOTY"]
+__all__ = [
+    "AOTY",
+    "AsyncAOTY",
+    "PageLimitError",
+    "disable_page_cache",
+    "enable_page_cache",
+]
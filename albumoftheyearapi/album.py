@@ -1,25 +1,84 @@
-import json
-from urllib.request import Request, urlopen
-from bs4 import BeautifulSoup
+import html
+import io
+import itertools
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.error import URLError
+from lxml import etree
+
+from albumoftheyearapi.serializer import dumps, dumps_bytes
+from albumoftheyearapi.session import fetch_page
+from albumoftheyearapi.xpath import class_xpath
+
+MONTH_ABBREVIATIONS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Compiled once and reused for every album block
+ARTIST_TITLE_XPATH = etree.XPath(".//div" + class_xpath("artistTitle"))
+ALBUM_TITLE_XPATH = etree.XPath(".//div" + class_xpath("albumTitle"))
+RELEASE_DATE_XPATH = etree.XPath(".//div" + class_xpath("type"))
+
+UPCOMING_ALBUM_CLASS = "albumBlock five small"
+UPCOMING_ALBUM_MARKER = f'class="{UPCOMING_ALBUM_CLASS}"'.encode()
+
+# Fast path for the templated album blocks: artist, title and date of each block,
+# read straight from the raw page. Pages it doesn't fully match are parsed with lxml.
+ALBUM_BLOCK_RE = re.compile(
+    re.escape(UPCOMING_ALBUM_MARKER)
+    + rb'.*?class="artistTitle"[^>]*>([^<]*)</div>'
+    rb'.*?class="albumTitle"[^>]*>([^<]*)</div>'
+    rb'.*?class="type"[^>]*>([^<]*)</div>',
+    re.S,
+)
+
+
+def _decode_text(raw_text: bytes) -> str:
+    """
+    Decodes the raw UTF-8 text of an HTML element and resolves its character references.
+
+    Args:
+        raw_text (bytes): The text between an element's tags.
+
+    Returns:
+        str: The decoded text.
+    """
+    return html.unescape(raw_text.decode("utf-8", errors="replace"))
+
+
+class PageLimitError(Exception):
+    """
+    Raised when an upcoming releases page beyond the scraping page limit is requested.
+    """
 
 
+@dataclass(slots=True)
 class Album:
     """
     Represents an album with its name, artist, and release date.
+
+    Attributes:
+        name (str): The name of the album.
+        artist (str): The artist of the album.
+        release_date (str): The release date of the album (e.g., "Jan 1").
     """
 
-    def __init__(self, name: str, artist: str, date: str):
-        """
-        Initializes an Album object.
-
-        Args:
-            name (str): The name of the album.
-            artist (str): The artist of the album.
-            date (str): The release date of the album (e.g., "Jan 1").
-        """
-        self.name = name
-        self.artist = artist
-        self.release_date = date
+    name: str
+    artist: str
+    release_date: str
 
     def to_JSON(self) -> str:
         """
@@ -28,7 +87,7 @@ class Album:
         Returns:
             str: A JSON string representation of the Album object.
         """
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=0)
+        return dumps(self, sort_keys=True)
 
 
 class AlbumMethods:
@@ -38,22 +97,24 @@ class AlbumMethods:
     """
 
     BASE_URL = "https://www.albumoftheyear.org"
+    UPCOMING_URL = f"{BASE_URL}/upcoming/"
 
     def __init__(self):
         """
         Initializes the AlbumMethods class with configuration for web scraping.
         Sets the CSS class for identifying album blocks, the number of albums per page,
-        and a hardcoded page limit to prevent excessive scraping.
+        a hardcoded page limit to prevent excessive scraping, and the number of
+        pages that may be fetched concurrently.
         """
-        self.upcoming_album_class: str = "albumBlock five small"
+        self.upcoming_album_class: str = UPCOMING_ALBUM_CLASS
         self.aoty_albums_per_page: int = 60
         self.page_limit: int = 21
+        self.max_workers: int = 8
+        self.prefetch_pages: int = 3
 
     def upcoming_releases_by_limit(self, total: int) -> str:
         """
-        Fetches a specified total number of upcoming album releases.
-        It calculates the number of pages needed and scrapes them sequentially
-        until the desired total is met or the page limit is reached.
+        Fetches a specified total number of upcoming album releases as JSON.
 
         Args:
             total (int): The total number of upcoming albums to retrieve.
@@ -62,34 +123,62 @@ class AlbumMethods:
             str: A JSON string containing a list of Album objects, or an error message
                  if the requested total exceeds the scraping page limit or an error occurs.
         """
+        return dumps(self.upcoming_releases_by_limit_dict(total))
+
+    def upcoming_releases_by_limit_bytes(self, total: int) -> bytes:
+        """
+        Fetches a specified total number of upcoming album releases as JSON bytes.
+
+        Args:
+            total (int): The total number of upcoming albums to retrieve.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON of `upcoming_releases_by_limit`.
+        """
+        return dumps_bytes(self.upcoming_releases_by_limit_dict(total))
+
+    def upcoming_releases_by_limit_dict(self, total: int) -> dict:
+        """
+        Fetches a specified total number of upcoming album releases.
+        It calculates the number of pages needed and scrapes them concurrently,
+        stitching the results back together in page order.
+
+        Args:
+            total (int): The total number of upcoming albums to retrieve.
+
+        Returns:
+            dict: A dictionary with a list of Album objects under "albums", or an error
+                  dictionary if the requested total exceeds the scraping page limit or
+                  an error occurs.
+        """
         min_page_number = 1
         max_page_number = total // self.aoty_albums_per_page
         if total % self.aoty_albums_per_page != 0:
             max_page_number += 1
         upcoming_albums = {}
-        albums = []
-        counter = total
-        for page_number in range(min_page_number, max_page_number + 1):
-            try:
-                if counter < self.aoty_albums_per_page:
-                    albums += self._get_upcoming_releases_by_page(page_number)[:counter]
-                else:
-                    albums += self._get_upcoming_releases_by_page(page_number)
-                    counter -= self.aoty_albums_per_page
-            except Exception as e:
-                return json.dumps(
-                    self._build_error_response(
-                        "Page Limit Error",
-                        "Number of albums exceeded page limit. Exception raise: ." + str(e),
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages = executor.map(
+                    self._get_upcoming_releases_by_page,
+                    range(min_page_number, max_page_number + 1),
+                )
+                # A negative total asks for no albums rather than an invalid slice
+                albums = list(
+                    itertools.islice(
+                        itertools.chain.from_iterable(pages), max(total, 0)
                     )
                 )
-        json_albums = [album.to_JSON() for album in albums]
-        upcoming_albums["albums"] = json_albums
-        return json.dumps(upcoming_albums)
+        except Exception as e:
+            return self._build_error_response(
+                "Page Limit Error",
+                "Number of albums exceeded page limit. Exception raise: ." + str(e),
+            )
+        upcoming_albums["albums"] = albums
+        return upcoming_albums
 
     def upcoming_releases_by_page(self, page_number: int) -> str:
         """
-        Fetches upcoming album releases for a specific page number.
+        Fetches upcoming album releases for a specific page number as JSON.
 
         Args:
             page_number (int): The page number to retrieve.
@@ -98,20 +187,72 @@ class AlbumMethods:
             str: A JSON string containing a list of Album objects for the specified page,
                  or an error message if the page number is out of range.
         """
+        return dumps(self.upcoming_releases_by_page_dict(page_number))
+
+    def upcoming_releases_by_page_bytes(self, page_number: int) -> bytes:
+        """
+        Fetches upcoming album releases for a specific page number as JSON bytes.
+
+        Args:
+            page_number (int): The page number to retrieve.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON of `upcoming_releases_by_page`.
+        """
+        return dumps_bytes(self.upcoming_releases_by_page_dict(page_number))
+
+    def upcoming_releases_by_page_dict(self, page_number: int) -> dict:
+        """
+        Fetches upcoming album releases for a specific page number.
+
+        Args:
+            page_number (int): The page number to retrieve.
+
+        Returns:
+            dict: A dictionary with a list of Album objects under "albums", or an error
+                  dictionary if the page number is out of range or can't be fetched.
+
+        Raises:
+            Exception: Any other error, such as a page that can't be parsed.
+        """
         upcoming_albums = {}
         try:
             parsed_albums = self._get_upcoming_releases_by_page(page_number)
-        except:
-            return json.dumps(
-                self._build_error_response(
-                    "Page Limit Error", "The page number requested is out of range."
-                )
+        except (PageLimitError, URLError):
+            return self._build_error_response(
+                "Page Limit Error", "The page number requested is out of range."
             )
-        json_albums = [album.to_JSON() for album in parsed_albums]
-        upcoming_albums["albums"] = json_albums
-        return json.dumps(upcoming_albums)
+        upcoming_albums["albums"] = parsed_albums
+        return upcoming_albums
 
     def upcoming_releases_by_date(self, month: int, day: int) -> str:
+        """
+        Fetches upcoming album releases for a specific date as JSON.
+
+        Args:
+            month (int): The month number (1-12).
+            day (int): The day of the month.
+
+        Returns:
+            str: A JSON string containing a list of Album objects for the specified date,
+                 or an error message if an issue occurs during scraping or date mapping.
+        """
+        return dumps(self.upcoming_releases_by_date_dict(month, day))
+
+    def upcoming_releases_by_date_bytes(self, month: int, day: int) -> bytes:
+        """
+        Fetches upcoming album releases for a specific date as JSON bytes.
+
+        Args:
+            month (int): The month number (1-12).
+            day (int): The day of the month.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON of `upcoming_releases_by_date`.
+        """
+        return dumps_bytes(self.upcoming_releases_by_date_dict(month, day))
+
+    def upcoming_releases_by_date_dict(self, month: int, day: int) -> dict:
         """
         Fetches upcoming album releases for a specific date.
         It scrapes pages until all albums for the target date are found,
@@ -122,28 +263,25 @@ class AlbumMethods:
             day (int): The day of the month.
 
         Returns:
-            str: A JSON string containing a list of Album objects for the specified date,
-                 or an error message if an issue occurs during scraping or date mapping.
-        
-        Raises:
-            
+            dict: A dictionary with a list of Album objects under "albums", or an error
+                  dictionary if an issue occurs during scraping or date mapping.
         """
         upcoming_albums = {}
         try:
             parsed_albums = self._get_upcoming_releases_by_date(month, day)
         except Exception as e:
-            return json.dumps(
-                self._build_error_response("Releases by date Error: ", str(e))
-            )
-        json_albums = [album.to_JSON() for album in parsed_albums]
-        upcoming_albums["albums"] = json_albums
-        return json.dumps(upcoming_albums)
+            return self._build_error_response("Releases by date Error: ", str(e))
+        upcoming_albums["albums"] = parsed_albums
+        return upcoming_albums
 
     def _get_upcoming_releases_by_date(self, month: int, day: int) -> list[Album]:
         """
         Internal method to scrape upcoming releases for a specific date.
-        It iterates through pages, collecting albums until it finds an album
-        from the day after the target date, indicating all relevant albums have been found.
+        It skips the pages that end before the target date, then iterates through
+        pages, collecting albums until it finds an album from the day after the
+        target date, indicating all relevant albums have been found.
+        Pages that weren't fetched while probing are prefetched concurrently in
+        batches of `prefetch_pages`.
 
         Args:
             month (int): The month number (1-12).
@@ -153,7 +291,8 @@ class AlbumMethods:
             list[Album]: A list of Album objects released on the target date.
 
         Raises:
-            Exception: If the month number is invalid or a scraping error occurs.
+            ValueError: If the month number is invalid.
+            Exception: If a scraping error occurs.
         """
         month_name = self._map_month_number_to_name(month)
         target_date = (month_name + " " + str(day)).strip()
@@ -170,21 +309,114 @@ class AlbumMethods:
         next_month_name = self._map_month_number_to_name(next_month)
         next_date = (next_month_name + " " + str(next_day)).strip()
 
-        page_number = 1
+        # Pages already fetched while looking for the first relevant page
+        probed_pages = {}
+        page_number = self._find_first_page_for_date(month, day, probed_pages)
         result_albums = []
         complete = False
 
-        while not complete:
-            albums = self._get_upcoming_releases_by_page(page_number)
-            for album in albums:
-                if album.release_date == target_date:
-                    result_albums.append(album)
-                # Check if we've reached the next day, if so, stop scraping
-                if album.release_date == next_date:
-                    complete = True
-            page_number += 1
+        with ThreadPoolExecutor(max_workers=self.prefetch_pages) as executor:
+            while not complete:
+                if page_number in probed_pages:
+                    # Check a page that was already fetched before prefetching past it
+                    last_page_number = page_number
+                    pages = [probed_pages[page_number]]
+                else:
+                    # Never prefetch past the page limit or the next probed page, but
+                    # still request at least one page so that running off the end
+                    # raises as before.
+                    last_page_number = max(
+                        page_number,
+                        min(page_number + self.prefetch_pages - 1, self.page_limit),
+                    )
+                    last_page_number = min(
+                        [last_page_number]
+                        + [
+                            number - 1
+                            for number in probed_pages
+                            if number > page_number
+                        ]
+                    )
+                    pages = executor.map(
+                        self._get_upcoming_releases_by_page,
+                        range(page_number, last_page_number + 1),
+                    )
+                for albums in pages:
+                    for album in albums:
+                        if album.release_date == target_date:
+                            result_albums.append(album)
+                        # Check if we've reached the next day, if so, stop scraping
+                        if album.release_date == next_date:
+                            complete = True
+                    if complete:
+                        break
+                page_number = last_page_number + 1
         return result_albums
 
+    def _find_first_page_for_date(
+        self, month: int, day: int, probed_pages: dict[int, list[Album]]
+    ) -> int:
+        """
+        Internal method to find the first page that may hold albums released on a date.
+        Upcoming pages are ordered by release date, so it probes the last album of
+        pages 1, 2, 4, 8, ... and skips every page that ends before the target date.
+        A probe that can't be fetched is past the last page and ends the search.
+        Dates earlier in the year than the first upcoming release belong to next year.
+
+        Args:
+            month (int): The month number (1-12).
+            day (int): The day of the month.
+            probed_pages (dict[int, list[Album]]): Filled with the albums of every
+                page fetched while probing, keyed by page number, so they can be reused.
+
+        Returns:
+            int: The page number to start scanning from.
+        """
+        first_page_number = 1
+        page_number = 1
+        target = None
+        while page_number <= self.page_limit:
+            try:
+                albums = self._get_upcoming_releases_by_page(page_number)
+            except (PageLimitError, URLError):
+                # The probe landed past the last page, so the date lies below it
+                break
+            probed_pages[page_number] = albums
+            if not albums:
+                break
+            if target is None:
+                anchor = self._parse_release_date(albums[0].release_date)
+                if anchor is None:
+                    break
+                # Sort dates before the first upcoming release after every later date
+                target = ((month, day) < anchor, (month, day))
+            last_date = self._parse_release_date(albums[-1].release_date)
+            if last_date is None or (last_date < anchor, last_date) >= target:
+                break
+            first_page_number = page_number + 1
+            page_number *= 2
+        return first_page_number
+
+    def _parse_release_date(self, release_date: str) -> tuple[int, int] | None:
+        """
+        Internal method to convert a release date such as "Jan 5" to a (month, day) tuple.
+
+        Args:
+            release_date (str): The release date shown on the upcoming page.
+
+        Returns:
+            tuple[int, int] | None: The month number and day, or None if the release
+                                    date isn't a month and day (e.g., "TBA").
+        """
+        parts = release_date.split()
+        if (
+            len(parts) != 2
+            or parts[0] not in MONTH_ABBREVIATIONS
+            or not parts[1].isdigit()
+        ):
+            return None
+        return MONTH_ABBREVIATIONS.index(parts[0]) + 1, int(parts[1])
+
     def _build_error_response(self, error_type: str, msg: str) -> dict:
         """
         Internal method to build a standardized error response dictionary.
@@ -210,25 +442,11 @@ class AlbumMethods:
             str: The three-letter abbreviation of the month (e.g., "Jan", "Feb").
 
         Raises:
-            Exception: If the month number is invalid (not between 1 and 12).
-        """
-        month_names = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-        if not 1 <= month_number <= 12:
-            raise Exception("Invalid month number")
-        return month_names[month_number - 1]
+            ValueError: If the month number is invalid (not between 1 and 12).
+        """
+        if not 1 <= month_number <= len(MONTH_ABBREVIATIONS):
+            raise ValueError("Invalid month number")
+        return MONTH_ABBREVIATIONS[month_number - 1]
 
     def _get_upcoming_releases_by_page(self, page_number: int) -> list[Album]:
         """
@@ -242,51 +460,88 @@ class AlbumMethods:
             list[Album]: A list of Album objects found on the specified page.
 
         Raises:
-            Exception: If the page number exceeds the defined page limit.
+            PageLimitError: If the page number exceeds the defined page limit.
+            URLError: If the page can't be fetched.
         """
         if page_number > self.page_limit:
-            raise Exception("Page number out of range")
-        url = f"{self.BASE_URL}/upcoming/" + (f"{page_number}/" if page_number > 1 else "")
-        page = self._get_release_page_from_request(url)
-        albums = page.find_all("div", {"class": self.upcoming_album_class})
-        parsed_albums = self._parse_albums(albums)
+            raise PageLimitError("Page number out of range")
+        if page_number > 1:
+            url = f"{self.UPCOMING_URL}{page_number}/"
+        else:
+            url = self.UPCOMING_URL
+        unparsed_page = fetch_page(url)
+        parsed_albums = self._parse_album_page(unparsed_page)
         return parsed_albums
 
-    def _get_release_page_from_request(self, url: str) -> BeautifulSoup:
+    def _parse_album_page(self, unparsed_page: bytes) -> list[Album]:
         """
-        Internal method to fetch and parse an HTML page from a given URL.
-        It uses urllib.request to make the HTTP request and BeautifulSoup to parse the HTML.
+        Internal method to parse the upcoming album blocks of a raw HTML page.
+        The fields are read with a regular expression when it matches every album
+        block on the page, otherwise the page is parsed with lxml.
 
         Args:
-            url (str): The URL of the page to fetch.
+            unparsed_page (bytes): The raw HTML content of an upcoming releases page.
 
         Returns:
-            BeautifulSoup: A BeautifulSoup object representing the parsed HTML content.
-
-        Raises:
-            URLError: If there's an issue with the network request (e.g., invalid URL, connection error).
+            list[Album]: A list of Album objects found on the page.
+        """
+        if self.upcoming_album_class == UPCOMING_ALBUM_CLASS:
+            matches = ALBUM_BLOCK_RE.findall(unparsed_page)
+            # A page without the exact marker may still hold blocks lxml can find
+            if matches and len(matches) == unparsed_page.count(UPCOMING_ALBUM_MARKER):
+                return [
+                    Album(_decode_text(title), _decode_text(artist), _decode_text(date))
+                    for artist, title, date in matches
+                ]
+        return self._parse_albums(self._iter_album_blocks(unparsed_page))
+
+    def _iter_album_blocks(self, unparsed_page: bytes) -> Iterator[etree._Element]:
         """
-        request = Request(url, headers={"User-Agent": "Mozilla/6.0"})
-        unparsed_page = urlopen(request).read()
-        release_page = BeautifulSoup(unparsed_page, "html.parser")
-        return release_page
+        Internal method to stream the upcoming album blocks out of a raw HTML page.
+        The page is parsed incrementally with lxml's iterparse, and each block is
+        cleared once the caller moves on, so the full document tree is never built.
+
+        Args:
+            unparsed_page (bytes): The raw HTML content of an upcoming releases page.
 
-    def _parse_albums(self, unparsed_albums: list) -> list[Album]:
+        Yields:
+            etree._Element: Each complete album block, in document order.
         """
-        Parses a list of BeautifulSoup tag objects (representing raw album HTML blocks)
-        into a list of Album objects. Extracts artist, title, and date from each block.
+        blocks = etree.iterparse(
+            io.BytesIO(unparsed_page),
+            events=("end",),
+            tag="div",
+            html=True,
+            encoding="utf-8",
+        )
+        for _, element in blocks:
+            if element.get("class") != self.upcoming_album_class:
+                continue
+            yield element
+            # Drop the block and everything parsed before it
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _parse_albums(self, unparsed_albums: Iterable) -> list[Album]:
+        """
+        Parses lxml elements (representing raw album HTML blocks) into a list of
+        Album objects. Extracts artist, title, and date from each block.
 
         Args:
-            unparsed_albums (list): A list of BeautifulSoup tag objects, each containing
-                                    the HTML structure for an album.
+            unparsed_albums (Iterable): lxml elements, each containing the HTML
+                                        structure for an album.
 
         Returns:
             list[Album]: A list of Album objects, each populated with extracted data.
+
+        Raises:
+            IndexError: If an album block is missing its artist, title, or date.
         """
         parsed_albums = []
         for album in unparsed_albums:
-            artist = str(album.find("div", {"class": "artistTitle"}).getText())
-            title = str(album.find("div", {"class": "albumTitle"}).getText())
-            date = str(album.find("div", {"class": "type"}).getText())
+            artist = "".join(ARTIST_TITLE_XPATH(album)[0].itertext())
+            title = "".join(ALBUM_TITLE_XPATH(album)[0].itertext())
+            date = "".join(RELEASE_DATE_XPATH(album)[0].itertext())
             parsed_albums.append(Album(title, artist, date))
         return parsed_albums
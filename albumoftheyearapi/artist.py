@@ -1,6 +1,44 @@
-import json
-from urllib.request import Request, urlopen
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from dataclasses import dataclass
+from bs4 import BeautifulSoup, SoupStrainer
+
+from albumoftheyearapi.serializer import dumps
+from albumoftheyearapi.session import fetch_page
+from albumoftheyearapi.text import strip_non_ascii
+
+# Headings, divs and table rows hold everything the artist methods read
+ARTIST_PAGE_STRAINER = SoupStrainer(["h1", "h2", "div", "tr"])
+
+# Number of parsed artist pages kept per client before the least recently used is dropped
+ARTIST_PAGE_CACHE_SIZE = 128
+
+# Category headings, release titles and similar artist names on an artist page
+DISCOGRAPHY_SELECTOR = "h2, div div.albumTitle, div div.name"
+
+# Classes of the single-value fields at the top of an artist page
+TOP_BOX_CLASSES = (
+    "artistHeadline",
+    "artistCriticScore",
+    "artistUserScore",
+    "followCount",
+    "artistTopBox info",
+)
+
+
+@dataclass
+class ArtistPage:
+    """
+    A parsed artist page together with the data extracted from it.
+    """
+
+    page: BeautifulSoup
+    albums: list[str]
+    mixtapes: list[str]
+    eps: list[str]
+    singles: list[str]
+    similar_artists: list[str]
+    top_songs: list[str]
+    top_box: dict[str, str]
 
 
 class ArtistMethods:
@@ -17,21 +55,36 @@ class ArtistMethods:
         Initializes the ArtistMethods class with default attributes.
 
         Attributes are set up to store artist information, URLs, and parsed
-        page content for subsequent data extraction.
+        page content for subsequent data extraction. Parsed pages are cached
+        by URL so switching back to a previously loaded artist is free.
         """
         self.artist = ""
         self.url = ""
         self.artist_url = "https://www.albumoftheyear.org/artist/"
+        self.artist_page_cache: OrderedDict[str, ArtistPage] = OrderedDict()
         
         self.albums = []
 
+    def _artist_url(self, artist: str) -> str:
+        """
+        Builds the URL of an artist's page on Album of the Year.
+
+        Args:
+            artist (str): The name of the artist.
+
+        Returns:
+            str: The URL of the artist's page.
+        """
+        return f"{self.artist_url}{artist}/"
+
     def __set_artist_page(self, artist: str, url: str) -> None:
         """
         Sets up the artist page for scraping by fetching and parsing the HTML.
 
         This private method is responsible for making the HTTP request to the
-        artist's page URL, reading the content, and parsing it with BeautifulSoup.
-        It also triggers the discography and community data extraction.
+        artist's page URL, reading the content, and parsing it with BeautifulSoup
+        using the lxml parser. It also triggers the discography and community data extraction.
+        Pages that were already loaded are served from the page cache instead.
 
         Args:
             artist (str): The name of the artist.
@@ -46,18 +99,47 @@ class ArtistMethods:
         """
         self.artist = artist
         self.url = url
-        self.req = Request(self.url, headers={"User-Agent": "Mozilla/6.0"})
-        ugly_artist_page = urlopen(self.req).read()
-        self.artist_page = BeautifulSoup(ugly_artist_page, "html.parser")
+
+        cached_page = self.artist_page_cache.get(url)
+        if cached_page is not None:
+            self.artist_page_cache.move_to_end(url)
+            self.artist_page = cached_page.page
+            self.albums = cached_page.albums
+            self.mixtapes = cached_page.mixtapes
+            self.eps = cached_page.eps
+            self.singles = cached_page.singles
+            self.similar_artists_cat = cached_page.similar_artists
+            self.top_songs = cached_page.top_songs
+            self.top_box = cached_page.top_box
+            return
+
+        ugly_artist_page = fetch_page(self.url)
+        self.artist_page = BeautifulSoup(
+            ugly_artist_page, "lxml", parse_only=ARTIST_PAGE_STRAINER
+        )
         self.__get_discography(artist)
         self.__get_community_data(artist)
+        self.__get_top_box(artist)
+
+        self.artist_page_cache[url] = ArtistPage(
+            page=self.artist_page,
+            albums=self.albums,
+            mixtapes=self.mixtapes,
+            eps=self.eps,
+            singles=self.singles,
+            similar_artists=self.similar_artists_cat,
+            top_songs=self.top_songs,
+            top_box=self.top_box,
+        )
+        if len(self.artist_page_cache) > ARTIST_PAGE_CACHE_SIZE:
+            self.artist_page_cache.popitem(last=False)
 
     def __class_text(self, artist: str, class_name: str, url: str) -> str:
         """
-        Extracts text content from a specific HTML element identified by its class name.
+        Returns the text of a top box element identified by its class name.
 
         This private helper method ensures the correct artist page is loaded
-        before attempting to find and extract text from an element.
+        before reading the text extracted by __get_top_box.
 
         Args:
             artist (str): The name of the artist.
@@ -70,7 +152,31 @@ class ArtistMethods:
         if self.url != url:
             self.__set_artist_page(artist, url)
 
-        return self.artist_page.find(class_=class_name).getText()
+        return self.top_box[class_name]
+
+    def __get_top_box(self, artist: str) -> None:
+        """
+        Extracts the single-value fields at the top of the artist's page.
+
+        This private method collects the headline, critic and user scores,
+        follower count and details in one traversal of the parsed HTML, keyed
+        by class name. The extracted data is stored in an instance attribute.
+
+        Args:
+            artist (str): The name of the artist.
+
+        Returns:
+            None
+        """
+        top_box = {}
+        for element in self.artist_page.find_all(class_=list(TOP_BOX_CLASSES)):
+            classes = element.get("class", [])
+            for class_name in (" ".join(classes), *classes):
+                # Keep the first match, as find() would
+                if class_name in TOP_BOX_CLASSES and class_name not in top_box:
+                    top_box[class_name] = element.getText()
+
+        self.top_box = top_box
 
     def __get_discography(self, artist: str) -> None:
         """
@@ -86,35 +192,31 @@ class ArtistMethods:
         Returns:
             None
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
 
         # Dictionary to store albums under their respective categories
         categorized_albums = {}
 
-        # Find all h2 and div elements inside the artist page
-        elements = self.artist_page.find_all(["h2", "div"])
-        current_category = None  # To track which category the divs belong to
+        # Select only the category headings and title divs, in document order
+        elements = self.artist_page.select(DISCOGRAPHY_SELECTOR)
+        current_category = None  # To track which category the titles belong to
 
         for element in elements:
             if element.name == "h2":
                 # New category found, update current_category
                 current_category = element.get_text(strip=True)
                 categorized_albums[current_category] = []  # Initialize list for this category
-            elif element.name == "div" and current_category == "Similar Artists":
-                # Similar Artists is structured differently
-                album_title_div = element.find("div", class_="name")
-                if album_title_div:
-                    album_name = album_title_div.get_text().encode("ascii", "ignore").decode().strip()
+            elif current_category == "Similar Artists":
+                # Similar Artists is structured differently and uses name divs
+                if "name" in element["class"]:
+                    album_name = strip_non_ascii(element.get_text())
                     categorized_albums[current_category].append(album_name)
-            elif element.name == "div" and current_category:
-                # For each category, loop through all divs to find the album title
-                album_title_div = element.find("div", class_="albumTitle")
-                if album_title_div:
-                    album_name = album_title_div.get_text().encode("ascii", "ignore").decode().strip()
-                    categorized_albums[current_category].append(album_name)
-                
+            elif current_category and "albumTitle" in element["class"]:
+                album_name = strip_non_ascii(element.get_text())
+                categorized_albums[current_category].append(album_name)
+
         self.albums = categorized_albums['Albums']
         self.mixtapes = categorized_albums['Mixtapes']
         self.eps = categorized_albums['EPs']
@@ -137,7 +239,7 @@ class ArtistMethods:
         Returns:
             None
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
 
@@ -169,7 +271,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of album titles.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
             
@@ -186,7 +288,7 @@ class ArtistMethods:
             str: A JSON string representing the list of album titles.
         """
         albums_JSON = {"albums": self.artist_albums(artist)}
-        return json.dumps(albums_JSON)
+        return dumps(albums_JSON)
 
     def artist_mixtapes(self, artist: str) -> list[str]:
         """
@@ -198,7 +300,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of mixtape titles.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
             
@@ -215,7 +317,7 @@ class ArtistMethods:
             str: A JSON string representing the list of mixtape titles.
         """
         mixtapes_JSON = {"mixtapes": self.artist_mixtapes(artist)}
-        return json.dumps(mixtapes_JSON)
+        return dumps(mixtapes_JSON)
 
     def artist_eps(self, artist: str) -> list[str]:
         """
@@ -227,7 +329,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of EP titles.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
             
@@ -244,7 +346,7 @@ class ArtistMethods:
             str: A JSON string representing the list of EP titles.
         """
         eps_JSON = {"eps": self.artist_eps(artist)}
-        return json.dumps(eps_JSON)
+        return dumps(eps_JSON)
 
     def artist_singles(self, artist: str) -> list[str]:
         """
@@ -256,7 +358,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of single titles.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
         
@@ -273,7 +375,7 @@ class ArtistMethods:
             str: A JSON string representing the list of single titles.
         """
         singles_JSON = {"singles": self.artist_singles(artist)}
-        return json.dumps(singles_JSON)
+        return dumps(singles_JSON)
 
     def artist_name(self, artist: str) -> str:
         """
@@ -285,9 +387,7 @@ class ArtistMethods:
         Returns:
             str: The official artist name.
         """
-        return self.__class_text(
-            artist, "artistHeadline", self.artist_url + artist + "/"
-        )
+        return self.__class_text(artist, "artistHeadline", self._artist_url(artist))
 
     def artist_name_json(self, artist: str) -> str:
         """
@@ -300,7 +400,7 @@ class ArtistMethods:
             str: A JSON string representing the artist's name.
         """
         name_JSON = {"name": self.artist_name(artist)}
-        return json.dumps(name_JSON)
+        return dumps(name_JSON)
 
     def artist_critic_score(self, artist: str) -> str:
         """
@@ -312,9 +412,7 @@ class ArtistMethods:
         Returns:
             str: The critic score as a string.
         """
-        return self.__class_text(
-            artist, "artistCriticScore", self.artist_url + artist + "/"
-        )
+        return self.__class_text(artist, "artistCriticScore", self._artist_url(artist))
 
     def artist_critic_score_json(self, artist: str) -> str:
         """
@@ -327,7 +425,7 @@ class ArtistMethods:
             str: A JSON string representing the critic score.
         """
         critic_score_JSON = {"critic score": self.artist_critic_score(artist)}
-        return json.dumps(critic_score_JSON)
+        return dumps(critic_score_JSON)
 
     def artist_user_score(self, artist: str) -> str:
         """
@@ -339,9 +437,7 @@ class ArtistMethods:
         Returns:
             str: The user score as a string.
         """
-        return self.__class_text(
-            artist, "artistUserScore", self.artist_url + artist + "/"
-        )
+        return self.__class_text(artist, "artistUserScore", self._artist_url(artist))
 
     def artist_user_score_json(self, artist: str) -> str:
         """
@@ -354,7 +450,7 @@ class ArtistMethods:
             str: A JSON string representing the user score.
         """
         user_score_JSON = {"user score": self.artist_user_score(artist)}
-        return json.dumps(user_score_JSON)
+        return dumps(user_score_JSON)
 
     def artist_total_score(self, artist: str) -> float:
         """
@@ -381,7 +477,7 @@ class ArtistMethods:
             str: A JSON string representing the total score.
         """
         total_score_JSON = {"total score": self.artist_total_score(artist)}
-        return json.dumps(total_score_JSON)
+        return dumps(total_score_JSON)
 
     def artist_follower_count(self, artist: str) -> str:
         """
@@ -393,7 +489,7 @@ class ArtistMethods:
         Returns:
             str: The follower count as a string.
         """
-        return self.__class_text(artist, "followCount", self.artist_url + artist + "/")
+        return self.__class_text(artist, "followCount", self._artist_url(artist))
 
     def artist_follower_count_json(self, artist: str) -> str:
         """
@@ -406,7 +502,7 @@ class ArtistMethods:
             str: A JSON string representing the follower count.
         """
         follower_count_JSON = {"follower count": self.artist_follower_count(artist)}
-        return json.dumps(follower_count_JSON)
+        return dumps(follower_count_JSON)
 
     def artist_details(self, artist: str) -> str:
         """
@@ -418,9 +514,7 @@ class ArtistMethods:
         Returns:
             str: A string containing general artist details.
         """
-        return self.__class_text(
-            artist, "artistTopBox info", self.artist_url + artist + "/"
-        )
+        return self.__class_text(artist, "artistTopBox info", self._artist_url(artist))
 
     def artist_details_json(self, artist: str) -> str:
         """
@@ -433,7 +527,7 @@ class ArtistMethods:
             str: A JSON string representing the artist's details.
         """
         artist_details_JSON = {"artist details": self.artist_details(artist)}
-        return json.dumps(artist_details_JSON)
+        return dumps(artist_details_JSON)
 
     def artist_top_songs(self, artist: str) -> list[str]:
         """
@@ -445,7 +539,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of top song titles.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
             
@@ -462,7 +556,7 @@ class ArtistMethods:
             str: A JSON string representing the list of top song titles.
         """
         artist_top_songs_JSON = {"top songs": self.artist_top_songs(artist)}
-        return json.dumps(artist_top_songs_JSON)
+        return dumps(artist_top_songs_JSON)
 
     def similar_artists(self, artist: str) -> list[str]:
         """
@@ -474,7 +568,7 @@ class ArtistMethods:
         Returns:
             list[str]: A list of similar artist names.
         """
-        url = self.artist_url + artist + "/"
+        url = self._artist_url(artist)
         if self.url != url:
             self.__set_artist_page(artist, url)
             
@@ -491,4 +585,4 @@ class ArtistMethods:
             str: A JSON string representing the list of similar artist names.
         """
         similar_artists_JSON = {"similar artists": self.similar_artists(artist)}
-        return json.dumps(similar_artists_JSON)
+        return dumps(similar_artists_JSON)
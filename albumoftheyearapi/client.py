@@ -1,5 +1,10 @@
 """ All methods used to get site data """
 
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+
 from albumoftheyearapi.user import UserMethods
 from albumoftheyearapi.artist import ArtistMethods
 from albumoftheyearapi.album import AlbumMethods
@@ -21,11 +26,108 @@ class AOTY(UserMethods, ArtistMethods, AlbumMethods):
         required for scraping and data retrieval from the Album of the Year website.
         They are also set up to facilitate easier caching of page content.
         """
-        self.user: str = ""
         self.artist: str = ""
         self.url: str = ""
         self.user_url: str = "https://www.albumoftheyear.org/user/"
         self.artist_url: str = "https://www.albumoftheyear.org/artist/"
+        self.user_page_cache: OrderedDict = OrderedDict()
+        self.user_profile_cache: OrderedDict = OrderedDict()
+        self.user_tree_cache: OrderedDict = OrderedDict()
+        self.artist_page_cache: OrderedDict = OrderedDict()
         self.upcoming_album_class: str = "albumBlock five small"
         self.aoty_albums_per_page: int = 60
         self.page_limit: int = 21
+        self.max_workers: int = 8
+        self.prefetch_pages: int = 3
+
+
+class AsyncAOTY:
+    """
+    An asyncio front-end for the AOTY client.
+
+    Every public AOTY method is available as a coroutine with the same name and
+    arguments, so many artists, users or pages can be fetched concurrently:
+
+        client = AsyncAOTY()
+        albums = await asyncio.gather(*[client.artist_albums(a) for a in artists])
+
+    The blocking fetch and parse runs in a worker thread. Each worker thread owns
+    its own AOTY client, so concurrent calls never clobber each other's page state.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the AsyncAOTY client with per-thread storage for AOTY clients.
+        """
+        self._local = threading.local()
+
+    def _client(self) -> AOTY:
+        """
+        Internal method to get the AOTY client owned by the current worker thread.
+
+        Returns:
+            AOTY: The AOTY client for the calling thread, created on first use.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = AOTY()
+        return client
+
+    async def user_full_profile(self, user: str) -> dict:
+        """
+        Retrieves everything scraped about a user, fetching their pages concurrently.
+
+        The main profile page, perfect scores page and liked albums page are each
+        loaded in their own worker thread, so the total time is that of the slowest
+        page rather than the sum of all three.
+
+        Args:
+            user (str): The username of the user.
+
+        Returns:
+            dict: The user's profile stats and "about" text, as returned by
+                  `_load_profile`, plus their "rating_distribution",
+                  "perfect_scores" and "liked_music".
+        """
+
+        def load_profile_page() -> dict:
+            client = self._client()
+            profile = dict(client._load_profile(user))
+            profile["rating_distribution"] = client.user_rating_distribution(user)
+            return profile
+
+        profile, perfect_scores, liked_music = await asyncio.gather(
+            asyncio.to_thread(load_profile_page),
+            asyncio.to_thread(lambda: self._client().user_perfect_scores(user)),
+            asyncio.to_thread(lambda: self._client().user_liked_music(user)),
+        )
+        profile["perfect_scores"] = perfect_scores
+        profile["liked_music"] = liked_music
+        return profile
+
+    def __getattr__(self, name: str):
+        """
+        Exposes every public AOTY method as a coroutine.
+
+        Args:
+            name (str): The name of the AOTY method.
+
+        Returns:
+            Callable: A coroutine function wrapping the AOTY method.
+
+        Raises:
+            AttributeError: If AOTY has no public method with that name.
+        """
+        method = getattr(AOTY, name, None)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        @functools.wraps(method)
+        async def coroutine(*args, **kwargs):
+            return await asyncio.to_thread(
+                lambda: getattr(self._client(), name)(*args, **kwargs)
+            )
+
+        return coroutine
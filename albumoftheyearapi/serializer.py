@@ -0,0 +1,35 @@
+""" JSON serialization shared by all methods """
+
+import orjson
+
+
+def dumps(obj, default=None, sort_keys: bool = False) -> str:
+    """
+    Serializes an object to a JSON string using orjson.
+
+    Args:
+        obj: The object to serialize.
+        default (Callable, optional): Called for objects orjson can't serialize natively.
+        sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
+
+    Returns:
+        str: The JSON string representation of the object.
+    """
+    return dumps_bytes(obj, default=default, sort_keys=sort_keys).decode()
+
+
+def dumps_bytes(obj, default=None, sort_keys: bool = False) -> bytes:
+    """
+    Serializes an object to UTF-8 encoded JSON bytes using orjson,
+    skipping the decode to str for callers that send or store the result.
+
+    Args:
+        obj: The object to serialize.
+        default (Callable, optional): Called for objects orjson can't serialize natively.
+        sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON representation of the object.
+    """
+    option = orjson.OPT_SORT_KEYS if sort_keys else None
+    return orjson.dumps(obj, default=default, option=option)
@@ -0,0 +1,228 @@
+""" Shared HTTP connection pool used to fetch site pages """
+
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from urllib.error import HTTPError, URLError
+
+import orjson
+import urllib3
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Ask for a compressed response; urllib3 decompresses it transparently.
+# Brotli is added to the accepted encodings when the brotli package is installed.
+HEADERS = {"User-Agent": "Mozilla/6.0", "Accept-Encoding": ACCEPT_ENCODING}
+
+# A single pool for the whole package so every page request reuses keep-alive
+# connections to albumoftheyear.org instead of paying a new TCP+TLS handshake.
+POOL = urllib3.PoolManager(
+    maxsize=16,
+    headers=HEADERS,
+    retries=Retry(total=3, backoff_factor=0.2),
+)
+
+
+@dataclass
+class CachedPage:
+    """
+    A page body stored with the validators the server sent for it.
+
+    Attributes:
+        body (bytes): The raw body of the page.
+        etag (str | None): The ETag header of the response, if any.
+        last_modified (str | None): The Last-Modified header of the response, if any.
+        stored_at (float): When the page was stored or last revalidated, as a Unix time.
+    """
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = 0.0
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Builds the headers asking the server to only resend the page if it changed.
+
+        Returns:
+            dict[str, str]: The If-None-Match and If-Modified-Since headers that apply.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    An on-disk cache of fetched pages keyed by URL.
+
+    Cached pages younger than `max_age` seconds are served without a request.
+    Older pages are revalidated with a conditional request, and a 304 response
+    reuses the stored body.
+    """
+
+    def __init__(self, directory: str = ".aoty_cache", max_age: float = 0.0):
+        """
+        Initializes the cache and creates its directory if needed.
+
+        Args:
+            directory (str, optional): Where cached pages are stored. Defaults to ".aoty_cache".
+            max_age (float, optional): How many seconds a page is served without
+                revalidating it. Defaults to 0, which always revalidates.
+        """
+        self.directory = directory
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """
+        Internal method to map a URL to the file its page is stored in.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            str: The path of the cache file.
+        """
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest())
+
+    def get(self, url: str) -> CachedPage | None:
+        """
+        Reads a cached page.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            CachedPage | None: The cached page, or None if it isn't cached or
+                               the cache file can't be read.
+        """
+        try:
+            with open(self._path(url), "rb") as cache_file:
+                metadata = orjson.loads(cache_file.readline())
+                body = cache_file.read()
+            return CachedPage(
+                body, metadata["etag"], metadata["last_modified"], metadata["stored_at"]
+            )
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def set(self, url: str, page: CachedPage) -> None:
+        """
+        Stores a page, replacing any previous copy atomically.
+
+        Args:
+            url (str): The URL of the page.
+            page (CachedPage): The page to store.
+        """
+        metadata = orjson.dumps(
+            {
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+                "stored_at": page.stored_at,
+            }
+        )
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as cache_file:
+                cache_file.write(metadata + b"\n")
+                cache_file.write(page.body)
+            os.replace(temp_path, self._path(url))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """
+        Checks whether a cached page can be served without revalidating it.
+
+        Args:
+            page (CachedPage): The cached page.
+
+        Returns:
+            bool: True if the page is younger than `max_age`.
+        """
+        return time.time() - page.stored_at < self.max_age
+
+
+# Disabled by default; see enable_page_cache
+page_cache: PageCache | None = None
+
+
+def enable_page_cache(
+    directory: str = ".aoty_cache", max_age: float = 0.0
+) -> PageCache:
+    """
+    Turns on the on-disk page cache for every page fetched by the package.
+
+    Args:
+        directory (str, optional): Where cached pages are stored. Defaults to ".aoty_cache".
+        max_age (float, optional): How many seconds a page is served without
+            revalidating it. Defaults to 0, which always revalidates.
+
+    Returns:
+        PageCache: The cache now in use.
+    """
+    global page_cache
+    page_cache = PageCache(directory, max_age)
+    return page_cache
+
+
+def disable_page_cache() -> None:
+    """
+    Turns off the on-disk page cache. Cached files are left on disk.
+    """
+    global page_cache
+    page_cache = None
+
+
+def fetch_page(url: str) -> bytes:
+    """
+    Fetches the raw content of a page using the shared connection pool.
+
+    Transient connection errors are retried by the pool before giving up, and
+    gzip, deflate or brotli encoded responses are decompressed. When the page cache is
+    enabled, cached pages are revalidated with a conditional request instead of
+    being downloaded again.
+
+    Args:
+        url (str): The URL of the page to fetch.
+
+    Returns:
+        bytes: The raw body of the response.
+
+    Raises:
+        URLError: If there's a problem with the network connection or URL.
+        HTTPError: If the server returns an HTTP error status.
+    """
+    cache = page_cache
+    cached_page = cache.get(url) if cache is not None else None
+    if cached_page is not None and cache.is_fresh(cached_page):
+        return cached_page.body
+
+    headers = HEADERS
+    if cached_page is not None:
+        headers = {**HEADERS, **cached_page.conditional_headers()}
+    try:
+        response = POOL.request("GET", url, headers=headers, decode_content=True)
+    except urllib3.exceptions.HTTPError as e:
+        raise URLError(e) from e
+
+    if response.status == 304 and cached_page is not None:
+        cached_page.stored_at = time.time()
+        cache.set(url, cached_page)
+        return cached_page.body
+    if response.status >= 400:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+
+    if cache is not None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified or cache.max_age > 0:
+            cache.set(url, CachedPage(response.data, etag, last_modified, time.time()))
+    return response.data
@@ -0,0 +1,25 @@
+""" Text cleanup shared by the scraping methods """
+
+import re
+import unicodedata
+
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]+")
+
+
+def strip_non_ascii(text: str) -> str:
+    """
+    Strips surrounding whitespace and converts a string to ASCII.
+
+    Accented letters and compatibility characters are decomposed first, so they
+    keep their ASCII base (é becomes e, ﬁ becomes fi), and whatever is still
+    non-ASCII is dropped. Most titles are already ASCII, so this is skipped for them.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        str: The stripped, ASCII-only text.
+    """
+    if not text.isascii():
+        text = NON_ASCII_RE.sub("", unicodedata.normalize("NFKD", text))
+    return text.strip()
@@ -1,7 +1,63 @@
-import json
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from bs4 import BeautifulSoup
+import re
+from collections import OrderedDict
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+from albumoftheyearapi.serializer import dumps
+from albumoftheyearapi.session import fetch_page
+from albumoftheyearapi.text import strip_non_ascii
+from albumoftheyearapi.xpath import class_xpath
+
+# Number of parsed user pages kept per client before the least recently used is dropped
+USER_PAGE_CACHE_SIZE = 128
+
+# Classes of the elements the user methods read
+PROFILE_STAT_CLASS = "profileStat"
+ABOUT_CLASS = "aboutUser"
+DIST_ROW_CLASS = "distRow"
+ALBUM_BLOCK_CLASS = "albumBlock"
+ARTIST_TITLE_CLASS = "artistTitle"
+ALBUM_TITLE_CLASS = "albumTitle"
+
+# Stat links, the about section, rating distribution rows and album blocks
+# of the main user page
+PROFILE_PAGE_STRAINER = SoupStrainer(["a", "div"])
+
+# Album blocks are all the perfect scores and liked albums pages are read for.
+# The strainer sees the raw class attribute, so the class is matched as one
+# of its space separated words.
+ALBUM_BLOCK_STRAINER = SoupStrainer(
+    class_=re.compile(rf"(^|\s){ALBUM_BLOCK_CLASS}(\s|$)")
+)
+
+# Liked albums pages are read with lxml directly; pages without a charset
+# declaration are still decoded as UTF-8
+UTF8_HTML_PARSER = etree.HTMLParser(encoding="utf-8")
+
+LIKED_ALBUM_XPATH = etree.XPath("//*" + class_xpath(ALBUM_BLOCK_CLASS))
+LIKED_ARTIST_XPATH = etree.XPath("string(.//*" + class_xpath(ARTIST_TITLE_CLASS) + ")")
+LIKED_TITLE_XPATH = etree.XPath("string(.//*" + class_xpath(ALBUM_TITLE_CLASS) + ")")
+
+# Score ranges of the rating distribution rows, in page order
+RATING_DISTRIBUTION_KEYS = (
+    "100",
+    "90-99",
+    "80-89",
+    "70-79",
+    "60-69",
+    "50-59",
+    "40-49",
+    "30-39",
+    "20-29",
+    "10-19",
+    "0-9",
+)
+
+# Profile stats linked from the user page, keyed by the last segment of their href
+PROFILE_STATS = ("ratings", "reviews", "lists", "followers")
+
+# Everything _load_profile reads, matched in a single walk of the page
+PROFILE_SELECTOR = f'[href^="/user/"], .{ABOUT_CLASS}'
 
 
 class UserMethods:
@@ -14,41 +70,141 @@ class UserMethods:
     by scraping the Album of the Year website.
     """
 
+    # AOTY also inherits from classes without slots, so only standalone
+    # UserMethods instances drop their __dict__
+    __slots__ = ("user_url", "user_page_cache", "user_profile_cache", "user_tree_cache")
+
     def __init__(self):
         """
         Initializes the UserMethods class with default attributes.
 
-        Attributes are set up to store user information, URLs, and parsed
-        page content for subsequent data extraction.
+        Parsed pages are cached by URL rather than tracking a single current
+        page, so any mix of calls for any users reuses every page still cached.
         """
-        self.user: str = ""
-        self.url: str = ""
         self.user_url: str = "https://www.albumoftheyear.org/user/"
-        self.user_page: BeautifulSoup = None
+        self.user_page_cache: OrderedDict[str, BeautifulSoup] = OrderedDict()
+        self.user_profile_cache: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self.user_tree_cache: OrderedDict[str, etree._Element] = OrderedDict()
 
-    def __set_user_page(self, user: str, url: str) -> None:
+    def _user_url(self, user: str, path: str = "") -> str:
         """
-        Sets up the user page for scraping by fetching and parsing the HTML.
-
-        This private method is responsible for making the HTTP request to the
-        user's page URL, reading the content, and parsing it with BeautifulSoup.
+        Builds the URL of one of a user's pages on Album of the Year.
 
         Args:
             user (str): The username of the user.
+            path (str, optional): The page below the user's profile, such as
+                "/liked/albums/". Defaults to the profile itself.
+
+        Returns:
+            str: The URL of the page.
+        """
+        return f"{self.user_url}{user}{path}"
+
+    def __get_user_page(
+        self, url: str, parse_only: SoupStrainer | None = None
+    ) -> BeautifulSoup:
+        """
+        Returns a user page parsed with BeautifulSoup, fetching it on a cache miss.
+
+        The page is fetched through the shared connection pool and parsed with
+        the lxml parser. Pages that were already loaded are served from the page
+        cache instead. Each URL is always parsed with the same strainer, so the
+        cache is keyed by URL.
+
+        Args:
             url (str): The URL of the user's page on Album of the Year.
+            parse_only (SoupStrainer | None, optional): Limits parsing to the tags
+                the caller reads. Defaults to None, which parses the whole page.
 
         Returns:
-            None
+            BeautifulSoup: The parsed page.
 
         Raises:
             URLError: If there's a problem with the network connection or URL.
             HTTPError: If the server returns an HTTP error status.
         """
-        self.user = user
-        self.url = url
-        self.req = Request(self.url, headers={"User-Agent": "Mozilla/6.0"})
-        ugly_user_page = urlopen(self.req).read()
-        self.user_page = BeautifulSoup(ugly_user_page, "html.parser")
+        page = self.user_page_cache.get(url)
+        if page is not None:
+            self.user_page_cache.move_to_end(url)
+            return page
+
+        ugly_user_page = fetch_page(url)
+        page = BeautifulSoup(ugly_user_page, "lxml", parse_only=parse_only)
+
+        self.user_page_cache[url] = page
+        if len(self.user_page_cache) > USER_PAGE_CACHE_SIZE:
+            self.user_page_cache.popitem(last=False)
+        return page
+
+    def __get_user_tree(self, url: str) -> etree._Element:
+        """
+        Fetches a user page and parses it with lxml, without building a BeautifulSoup tree.
+
+        Parsed trees are cached by URL in a bounded LRU like the BeautifulSoup pages.
+
+        Args:
+            url (str): The URL of the user's page on Album of the Year.
+
+        Returns:
+            etree._Element: The root of the parsed page.
+
+        Raises:
+            URLError: If there's a problem with the network connection or URL.
+            HTTPError: If the server returns an HTTP error status.
+        """
+        tree = self.user_tree_cache.get(url)
+        if tree is not None:
+            self.user_tree_cache.move_to_end(url)
+            return tree
+
+        tree = etree.fromstring(fetch_page(url), UTF8_HTML_PARSER)
+        if tree is None:  # lxml returns no root for an empty page
+            tree = etree.Element("html")
+        self.user_tree_cache[url] = tree
+        if len(self.user_tree_cache) > USER_PAGE_CACHE_SIZE:
+            self.user_tree_cache.popitem(last=False)
+        return tree
+
+    def _load_profile(self, user: str) -> dict[str, str]:
+        """
+        Collects every profile stat and the "About Me" text of a user in one pass.
+
+        The user's main page is walked once for all the stat links and the about
+        section, the stats are matched by href with a dict lookup, and the result
+        is cached by username.
+
+        Args:
+            user (str): The username of the user.
+
+        Returns:
+            dict[str, str]: The text of each stat found ("ratings", "reviews",
+                            "lists", "followers") and the "about" text, which is
+                            empty if the user hasn't written one.
+        """
+        profile = self.user_profile_cache.get(user)
+        if profile is not None:
+            self.user_profile_cache.move_to_end(user)
+            return profile
+
+        url = self._user_url(user)
+        page = self.__get_user_page(url, PROFILE_PAGE_STRAINER)
+
+        stat_hrefs = {f"/user/{user}/{stat}/": stat for stat in PROFILE_STATS}
+        profile = {}
+        for tag in page.select(PROFILE_SELECTOR):
+            stat = stat_hrefs.get(tag.get("href"))
+            if stat is not None:
+                stat_tag = tag.find(class_=PROFILE_STAT_CLASS)
+                if stat_tag is not None and stat not in profile:
+                    profile[stat] = stat_tag.getText()
+            elif ABOUT_CLASS in tag.get("class", ()) and "about" not in profile:
+                profile["about"] = tag.getText()
+        profile.setdefault("about", "")
+
+        self.user_profile_cache[user] = profile
+        if len(self.user_profile_cache) > USER_PAGE_CACHE_SIZE:
+            self.user_profile_cache.popitem(last=False)
+        return profile
 
     def user_rating_count(self, user: str) -> str:
         """
@@ -59,16 +215,11 @@ class UserMethods:
 
         Returns:
             str: The count of user ratings as a string.
-        """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
 
-        ratings_section = self.user_page.find(
-            href=f"/user/{self.user}/ratings/"
-        )
-        ratings = ratings_section.find(class_="profileStat").getText()
-        return ratings
+        Raises:
+            KeyError: If the stat isn't shown on the user's page.
+        """
+        return self._load_profile(user)["ratings"]
 
     def user_rating_count_json(self, user: str) -> str:
         """
@@ -81,7 +232,7 @@ class UserMethods:
             str: A JSON string representing the count of user ratings.
         """
         ratings_JSON = {"ratings": self.user_rating_count(user)}
-        return json.dumps(ratings_JSON)
+        return dumps(ratings_JSON)
 
     def user_review_count(self, user: str) -> str:
         """
@@ -92,16 +243,11 @@ class UserMethods:
 
         Returns:
             str: The count of user reviews as a string.
-        """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
 
-        reviews_section = self.user_page.find(
-            href=f"/user/{self.user}/reviews/"
-        )
-        reviews = reviews_section.find(class_="profileStat").getText()
-        return reviews
+        Raises:
+            KeyError: If the stat isn't shown on the user's page.
+        """
+        return self._load_profile(user)["reviews"]
 
     def user_review_count_json(self, user: str) -> str:
         """
@@ -114,7 +260,7 @@ class UserMethods:
             str: A JSON string representing the count of user reviews.
         """
         reviews_JSON = {"reviews": self.user_review_count(user)}
-        return json.dumps(reviews_JSON)
+        return dumps(reviews_JSON)
 
     def user_list_count(self, user: str) -> str:
         """
@@ -125,16 +271,11 @@ class UserMethods:
 
         Returns:
             str: The count of user lists as a string.
-        """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
 
-        lists_section = self.user_page.find(
-            href=f"/user/{self.user}/lists/"
-        )
-        lists = lists_section.find(class_="profileStat").getText()
-        return lists
+        Raises:
+            KeyError: If the stat isn't shown on the user's page.
+        """
+        return self._load_profile(user)["lists"]
 
     def user_list_count_json(self, user: str) -> str:
         """
@@ -147,7 +288,7 @@ class UserMethods:
             str: A JSON string representing the count of user lists.
         """
         lists_JSON = {"lists": self.user_list_count(user)}
-        return json.dumps(lists_JSON)
+        return dumps(lists_JSON)
 
     def user_follower_count(self, user: str) -> str:
         """
@@ -158,16 +299,11 @@ class UserMethods:
 
         Returns:
             str: The count of user followers as a string.
-        """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
 
-        followers_section = self.user_page.find(
-            href=f"/user/{self.user}/followers/"
-        )
-        followers = followers_section.find(class_="profileStat").getText()
-        return followers
+        Raises:
+            KeyError: If the stat isn't shown on the user's page.
+        """
+        return self._load_profile(user)["followers"]
 
     def user_follower_count_json(self, user: str) -> str:
         """
@@ -180,7 +316,7 @@ class UserMethods:
             str: A JSON string representing the count of user followers.
         """
         followers_JSON = {"followers": self.user_follower_count(user)}
-        return json.dumps(followers_JSON)
+        return dumps(followers_JSON)
 
     def user_about(self, user: str) -> str:
         """
@@ -192,14 +328,7 @@ class UserMethods:
         Returns:
             str: The "About Me" text as a string.
         """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
-
-        about = self.user_page.find(class_="aboutUser")
-        if about is None:
-            return ""
-        return about.getText()
+        return self._load_profile(user)["about"]
 
     def user_about_json(self, user: str) -> str:
         """
@@ -212,7 +341,7 @@ class UserMethods:
             str: A JSON string representing the "About Me" text.
         """
         about_JSON = {"about_user": self.user_about(user)}
-        return json.dumps(about_JSON)
+        return dumps(about_JSON)
 
     def user_rating_distribution(self, user: str) -> list[str]:
         """
@@ -227,19 +356,16 @@ class UserMethods:
         Returns:
             list[str]: A list of strings representing the rating counts for each score range.
         """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
-
-        user_rating_distribution_tags = self.user_page.findAll(class_="distRow")
+        url = self._user_url(user)
+        page = self.__get_user_page(url, PROFILE_PAGE_STRAINER)
 
-        user_rating_distribution = []
-        for i in range(11):
-            tag_content = user_rating_distribution_tags[i].getText()
-            # Extract the number, assuming it's the last part after splitting by space
-            # and strip any whitespace. If content is empty, default to "0".
-            rating = tag_content.split()[-1].strip() if tag_content.strip() else "0"
-            user_rating_distribution.append(rating)
+        # Stop walking the tree once the 11 score ranges have been found
+        rows = page.find_all(class_=DIST_ROW_CLASS, limit=11)
+        # The count is the last word of each row; empty rows have no ratings
+        user_rating_distribution = [
+            text.rsplit(None, 1)[-1] if (text := row.get_text(" ", strip=True)) else "0"
+            for row in rows
+        ]
 
         return user_rating_distribution
 
@@ -256,23 +382,11 @@ class UserMethods:
         Returns:
             str: A JSON string representing the user's rating distribution.
         """
-        user_rating_distribution = self.user_rating_distribution(user)
-
-        user_rating_distribution_JSON = {
-            "100": user_rating_distribution[0],
-            "90-99": user_rating_distribution[1],
-            "80-89": user_rating_distribution[2],
-            "70-79": user_rating_distribution[3],
-            "60-69": user_rating_distribution[4],
-            "50-59": user_rating_distribution[5],
-            "40-49": user_rating_distribution[6],
-            "30-39": user_rating_distribution[7],
-            "20-29": user_rating_distribution[8],
-            "10-19": user_rating_distribution[9],
-            "0-9": user_rating_distribution[10],
-        }
+        user_rating_distribution_JSON = dict(
+            zip(RATING_DISTRIBUTION_KEYS, self.user_rating_distribution(user))
+        )
 
-        return json.dumps(user_rating_distribution_JSON)
+        return dumps(user_rating_distribution_JSON)
 
     def user_ratings(self, user: str) -> str:
         """
@@ -288,13 +402,12 @@ class UserMethods:
         Returns:
             str: A string containing a summary of user ratings.
         """
-        url = self.user_url + user
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
+        url = self._user_url(user)
+        page = self.__get_user_page(url, PROFILE_PAGE_STRAINER)
 
         # This might need more specific parsing if individual ratings are desired.
         # Currently, it returns the text of the first albumBlock found.
-        album_block = self.user_page.find(class_="albumBlock")
+        album_block = page.find(class_=ALBUM_BLOCK_CLASS)
         if album_block is None:
             return ""
         return album_block.getText()
@@ -310,7 +423,7 @@ class UserMethods:
             str: A JSON string representing the summary of user ratings.
         """
         ratings_JSON = {"ratings": self.user_ratings(user)}
-        return json.dumps(ratings_JSON)
+        return dumps(ratings_JSON)
 
     def user_perfect_scores(self, user: str) -> str:
         """
@@ -324,11 +437,10 @@ class UserMethods:
         Returns:
             str: A string containing details of perfect scores, or an empty string if none.
         """
-        url = self.user_url + user + "/ratings/perfect/"
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
+        url = self._user_url(user, "/ratings/perfect/")
+        page = self.__get_user_page(url, ALBUM_BLOCK_STRAINER)
 
-        perfect_scores = self.user_page.find(class_="albumBlock")
+        perfect_scores = page.find(class_=ALBUM_BLOCK_CLASS)
         if perfect_scores is None:
             return ""
         return perfect_scores.getText()
@@ -344,7 +456,7 @@ class UserMethods:
             str: A JSON string representing the user's perfect scores.
         """
         perfect_sccores_json = {"perfect scores": self.user_perfect_scores(user)}
-        return json.dumps(perfect_sccores_json)
+        return dumps(perfect_sccores_json)
 
     def user_liked_music(self, user: str) -> list[str]:
         """
@@ -356,32 +468,19 @@ class UserMethods:
         Returns:
             list[str]: A list of strings, each representing a liked album in "Artist: Album" format.
         """
-        url = self.user_url + user + "/liked/albums/"
-        if self.url != url or self.user_page is None:
-            self.__set_user_page(user, url)
-
-        liked_music = self.user_page.find_all(class_="albumBlock")
+        url = self._user_url(user, "/liked/albums/")
+        tree = self.__get_user_tree(url)
 
         result = []
-        for entry in liked_music:
-            artist_element = entry.find(class_="artistTitle")
-            album_element = entry.find(class_="albumTitle")
-
-            artist = ""
-            album = ""
-
-            if artist_element:
-                artist = artist_element.getText().encode("ascii", "ignore").decode().strip()
-            if album_element:
-                album = album_element.getText().encode("ascii", "ignore").decode().strip()
-            
+        for entry in LIKED_ALBUM_XPATH(tree):
+            artist = strip_non_ascii(LIKED_ARTIST_XPATH(entry))
+            album = strip_non_ascii(LIKED_TITLE_XPATH(entry))
+
             if artist and album:
-                combined = f"{artist}: {album}"
-                result.append(combined)
-            elif album: # If only album title is found
+                result.append(f"{artist}: {album}")
+            elif album:  # If only album title is found
                 result.append(album)
 
-
         return result
 
     def user_liked_music_json(self, user: str) -> str:
@@ -395,5 +494,5 @@ class UserMethods:
             str: A JSON string representing the list of liked music.
         """
         liked_music_json = {"liked music": self.user_liked_music(user)}
-        return json.dumps(liked_music_json)
+        return dumps(liked_music_json)
 
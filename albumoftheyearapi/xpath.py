@@ -0,0 +1,14 @@
+""" XPath helpers shared by the scraping methods """
+
+
+def class_xpath(class_name: str) -> str:
+    """
+    Builds an XPath predicate matching elements that have a class, like ".class" in CSS.
+
+    Args:
+        class_name (str): The class to match.
+
+    Returns:
+        str: The XPath predicate.
+    """
+    return f'[contains(concat(" ", normalize-space(@class), " "), " {class_name} ")]'
@@ -19,7 +19,9 @@ setuptools.setup(
     author="Jahsias White",
     author_email="jahsias.white@gmail.com",
     packages=["albumoftheyearapi"],
+    python_requires=">=3.10",
     install_requires=install_requires,
+    extras_require={"brotli": ["brotli"]},
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/JahsiasWhite/AlbumOfTheYearWrapper",
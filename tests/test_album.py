@@ -1,11 +1,13 @@
 import json
 import datetime
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
 
+import lxml.html
 import pytest
 
 # Import the classes directly from album.py for unit testing
-from albumoftheyearapi.album import Album, AlbumMethods
+from albumoftheyearapi.album import Album, AlbumMethods, PageLimitError
 
 
 @pytest.fixture
@@ -32,6 +34,13 @@ def test_album_init():
     assert album.release_date == "Dec 25"
 
 
+def test_album_has_no_instance_dict():
+    """Test that Album uses slots instead of a per-instance __dict__."""
+    album = Album("My Album", "My Artist", "Dec 25")
+    assert not hasattr(album, "__dict__")
+    assert album == Album("My Album", "My Artist", "Dec 25")
+
+
 def test_album_to_json():
     """Test conversion of an Album object to a JSON string."""
     album = Album("Test Album", "Test Artist", "Feb 15")
@@ -47,6 +56,8 @@ def test_album_methods_init(album_methods_client):
     assert album_methods_client.upcoming_album_class == "albumBlock five small"
     assert album_methods_client.aoty_albums_per_page == 60
     assert album_methods_client.page_limit == 21
+    assert album_methods_client.max_workers == 8
+    assert album_methods_client.prefetch_pages == 3
 
 
 # Test _map_month_number_to_name
@@ -72,8 +83,8 @@ def test_map_month_number_to_name_valid(album_methods_client, month_num, expecte
     ],
 )
 def test_map_month_number_to_name_invalid(album_methods_client, month_num):
-    """Test invalid month number to name mapping raises exception."""
-    with pytest.raises(Exception, match="Invalid month number"):
+    """Test invalid month number to name mapping raises ValueError."""
+    with pytest.raises(ValueError, match="Invalid month number"):
         album_methods_client._map_month_number_to_name(month_num)
 
 
@@ -86,26 +97,15 @@ def test_build_error_response(album_methods_client):
 
 def test_parse_albums_returns_correct_album_objects(album_methods_client):
     """Test that _parse_albums returns Album objects with correct fields."""
-    mock_album_block = MagicMock()
-    mock_artist = MagicMock()
-    mock_artist.getText.return_value = "Artist X"
-    mock_title = MagicMock()
-    mock_title.getText.return_value = "Album X"
-    mock_date = MagicMock()
-    mock_date.getText.return_value = "Mar 10"
-
-    def find_side_effect(name, attrs):
-        if name == "div" and attrs == {"class": "artistTitle"}:
-            return mock_artist
-        if name == "div" and attrs == {"class": "albumTitle"}:
-            return mock_title
-        if name == "div" and attrs == {"class": "type"}:
-            return mock_date
-        return None
-
-    mock_album_block.find.side_effect = find_side_effect
-
-    parsed_albums = album_methods_client._parse_albums([mock_album_block])
+    album_block = lxml.html.fragment_fromstring("""
+        <div class="albumBlock five small">
+            <div class="artistTitle">Artist X</div>
+            <div class="albumTitle">Album X</div>
+            <div class="type">Mar 10</div>
+        </div>
+    """)
+
+    parsed_albums = album_methods_client._parse_albums([album_block])
     assert len(parsed_albums) == 1
     album = parsed_albums[0]
     assert isinstance(album, Album)
@@ -120,44 +120,143 @@ def test_parse_albums_empty_list(album_methods_client):
     assert parsed_albums == []
 
 def test_parse_albums_handles_missing_fields(album_methods_client):
-    """Test that _parse_albums raises AttributeError if fields are missing."""
+    """Test that _parse_albums raises IndexError if fields are missing."""
     # Album block missing 'artistTitle'
-    album_block = MagicMock()
-    album_block.find.side_effect = lambda name, attrs: None
-    with pytest.raises(AttributeError):
+    album_block = lxml.html.fragment_fromstring(
+        '<div class="albumBlock five small"><div class="albumTitle">Album X</div></div>'
+    )
+    with pytest.raises(IndexError):
         album_methods_client._parse_albums([album_block])
 
 
-# Test _get_release_page_from_request
-@patch('albumoftheyearapi.album.urlopen')
-@patch('albumoftheyearapi.album.BeautifulSoup')
-def test_get_release_page_from_request_success(mock_bs, mock_urlopen, album_methods_client):
-    """Test successful fetching and parsing of a release page."""
-    mock_response = MagicMock()
-    mock_response.read.return_value = b"<html>mock html</html>"
-    mock_urlopen.return_value = mock_response
-    mock_bs.return_value = "mock_beautifulsoup_object"
-
-    result = album_methods_client._get_release_page_from_request("http://test.com")
-    mock_urlopen.assert_called_once()
-    mock_bs.assert_called_once_with(b"<html>mock html</html>", "html.parser")
-    assert result == "mock_beautifulsoup_object"
-
-
-@patch('albumoftheyearapi.album.urlopen', side_effect=Exception("Network error"))
-def test_get_release_page_from_request_error(mock_urlopen, album_methods_client):
-    """Test error handling during fetching a release page."""
+# Test _iter_album_blocks
+def test_iter_album_blocks_yields_upcoming_blocks(album_methods_client):
+    """Test that only complete upcoming album blocks are streamed, in document order."""
+    unparsed_page = """
+    <html><body>
+        <div class="albumBlock five small">
+            <div class="artistTitle">Bj\u00f6rk</div>
+            <div class="albumTitle">Album X</div>
+        </div>
+        <div class="albumBlock">Not upcoming</div>
+        <div class="albumBlock five small"><div class="albumTitle">Album Y</div></div>
+    </body></html>
+    """.encode("utf-8")
+
+    titles = []
+    for block in album_methods_client._iter_album_blocks(unparsed_page):
+        titles.append(block.xpath('string(.//div[@class="albumTitle"])'))
+        if len(titles) == 1:
+            assert block.xpath('string(.//div[@class="artistTitle"])') == "Bj\u00f6rk"
+    assert titles == ["Album X", "Album Y"]
+
+
+def test_iter_album_blocks_clears_consumed_blocks(album_methods_client):
+    """Test that blocks are cleared once the caller moves on to the next one."""
+    unparsed_page = b"""
+    <html><body>
+        <div class="albumBlock five small"><div class="albumTitle">Album X</div></div>
+        <div class="albumBlock five small"><div class="albumTitle">Album Y</div></div>
+    </body></html>
+    """
+
+    blocks = list(album_methods_client._iter_album_blocks(unparsed_page))
+    assert len(blocks) == 2
+    assert all(len(block) == 0 for block in blocks)
+
+
+@patch('albumoftheyearapi.album.fetch_page')
+def test_get_upcoming_releases_by_page_parses_album_blocks(mock_fetch_page, album_methods_client):
+    """Test that only the upcoming album blocks are parsed from a release page."""
+    mock_fetch_page.return_value = b"""
+    <html><body>
+        <div class="header">Upcoming Releases</div>
+        <div class="wrapper">
+            <div class="albumBlock five small">
+                <div class="artistTitle">Artist X</div>
+                <div class="albumTitle">Album X</div>
+                <div class="type">Mar 10</div>
+            </div>
+            <div class="albumBlock five small">
+                <div class="artistTitle">Artist Y</div>
+                <div class="albumTitle">Album Y</div>
+                <div class="type">Mar 11</div>
+            </div>
+            <div class="albumBlock">
+                <div class="albumTitle">Not upcoming</div>
+            </div>
+        </div>
+    </body></html>
+    """
+
+    parsed_albums = album_methods_client._get_upcoming_releases_by_page(1)
+    assert [album.name for album in parsed_albums] == ["Album X", "Album Y"]
+    assert [album.artist for album in parsed_albums] == ["Artist X", "Artist Y"]
+    assert parsed_albums[1].release_date == "Mar 11"
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._iter_album_blocks')
+def test_parse_album_page_regex_fast_path(mock_iter_album_blocks, album_methods_client):
+    """Test that templated album blocks are read without building a tree."""
+    unparsed_page = """
+    <div class="albumBlock five small" data-type="lp">
+        <a href="/artist/1-bjork/"><div class="artistTitle">Björk</div></a>
+        <a href="/album/2-x.php"><div class="albumTitle">Rock &amp; Roll</div></a>
+        <div class="type">Mar 10</div>
+    </div>
+    """.encode("utf-8")
+
+    parsed_albums = album_methods_client._parse_album_page(unparsed_page)
+    assert parsed_albums == [Album("Rock & Roll", "Björk", "Mar 10")]
+    mock_iter_album_blocks.assert_not_called()
+
+
+@pytest.mark.parametrize("unparsed_page", [
+    # Nested markup inside a field
+    b"""<div class="albumBlock five small">
+        <div class="artistTitle">Artist X</div>
+        <div class="albumTitle">Album <i>X</i></div>
+        <div class="type">Mar 10</div>
+    </div>""",
+    # Fields in an unexpected order
+    b"""<div class="albumBlock five small">
+        <div class="albumTitle">Album X</div>
+        <div class="artistTitle">Artist X</div>
+        <div class="type">Mar 10</div>
+    </div>""",
+    # Fields carrying extra classes
+    b"""<div class="albumBlock five small">
+        <div class="artistTitle small">Artist X</div>
+        <div class="albumTitle bold">Album X</div>
+        <div class="type date">Mar 10</div>
+    </div>""",
+    # Single quoted attributes leave no exact class marker for the regex to count
+    b"""<div class='albumBlock five small'>
+        <div class='artistTitle'>Artist X</div>
+        <div class='albumTitle'>Album X</div>
+        <div class='type'>Mar 10</div>
+    </div>""",
+])
+def test_parse_album_page_falls_back_to_lxml(album_methods_client, unparsed_page):
+    """Test that pages the regex doesn't fully match are parsed with lxml."""
+    parsed_albums = album_methods_client._parse_album_page(unparsed_page)
+    assert parsed_albums == [Album("Album X", "Artist X", "Mar 10")]
+
+
+@patch('albumoftheyearapi.album.fetch_page', side_effect=Exception("Network error"))
+def test_get_upcoming_releases_by_page_fetch_error(mock_fetch_page, album_methods_client):
+    """Test that errors while fetching a release page are propagated."""
     with pytest.raises(Exception, match="Network error"):
-        album_methods_client._get_release_page_from_request("http://test.com")
+        album_methods_client._get_upcoming_releases_by_page(1)
 
 
 # Test _get_upcoming_releases_by_page
-@patch('albumoftheyearapi.album.AlbumMethods._parse_albums')
-@patch('albumoftheyearapi.album.AlbumMethods._get_release_page_from_request')
-def test_get_upcoming_releases_by_page_success(mock_get_page, mock_parse_albums, album_methods_client, mock_album_objects):
+@patch('albumoftheyearapi.album.AlbumMethods._parse_album_page')
+@patch('albumoftheyearapi.album.fetch_page')
+def test_get_upcoming_releases_by_page_success(mock_get_page, mock_parse_album_page, album_methods_client, mock_album_objects):
     """Test successful scraping of upcoming releases for a specific page."""
-    mock_get_page.return_value.find_all.return_value = "mock_albums_html"
-    mock_parse_albums.return_value = mock_album_objects
+    mock_get_page.return_value = b"<html><body></body></html>"
+    mock_parse_album_page.return_value = mock_album_objects
 
     # Test page 1 (empty string URL)
     albums = album_methods_client._get_upcoming_releases_by_page(1)
@@ -173,7 +272,7 @@ def test_get_upcoming_releases_by_page_success(mock_get_page, mock_parse_albums,
 
 def test_get_upcoming_releases_by_page_limit_exceeded(album_methods_client):
     """Test that requesting a page beyond the limit raises an exception."""
-    with pytest.raises(Exception, match="Page number out of range"):
+    with pytest.raises(PageLimitError, match="Page number out of range"):
         album_methods_client._get_upcoming_releases_by_page(album_methods_client.page_limit + 1)
 
 
@@ -190,8 +289,9 @@ def test_get_upcoming_releases_by_date_internal_map_month_error(mock_map_month,
 def test_get_upcoming_releases_by_date_internal_success(mock_map_month, mock_get_upcoming_releases_by_page, album_methods_client):
     """Test internal method for scraping releases by date, including loop termination."""
     # Simulate albums across dates: 2 for Jan 1, 1 for Jan 2 (should stop after Jan 2 is found)
-    mock_get_upcoming_releases_by_page.side_effect = [
-        [
+    # Pages are prefetched concurrently, so key the mocked pages by page number.
+    pages = {
+        1: [
             Album("Album A", "Artist A", "Jan 1"),
             Album("Album B", "Artist B", "Jan 1"),
             Album("Album C", "Artist C", "Jan 2"),  # Next date, should not be included
@@ -200,10 +300,11 @@ def test_get_upcoming_releases_by_date_internal_success(mock_map_month, mock_get
             Album("Album E", "Artist E", "Jan 4"),  # Should not be included
             Album("Album F", "Artist F", "Jan 1"),  # Should be included too
         ],
-        [
+        2: [
             Album("Album E", "Artist E", "Jan 3"),  # Should not be reached
-        ]
-    ]
+        ],
+    }
+    mock_get_upcoming_releases_by_page.side_effect = lambda page_number: pages.get(page_number, [])
 
     result_albums = album_methods_client._get_upcoming_releases_by_date(1, 1)
     # Only albums with "Jan 1" before the first "Jan 2" should be included
@@ -219,14 +320,14 @@ def test_get_upcoming_releases_by_date_next_month(album_methods_client):
     """Test _get_upcoming_releases_by_date when the next day is in the next month."""
     # December 31st, next day is January 1st
     with patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page') as mock_get_page:
-        mock_get_page.side_effect = [
-            [
+        pages = {
+            1: [
                 Album("Album A", "Artist A", "Dec 31"),
                 Album("Album B", "Artist B", "Dec 31"),
                 Album("Album C", "Artist C", "Jan 1"),
             ],
-            []  # Empty page to stop the loop
-        ]
+        }
+        mock_get_page.side_effect = lambda page_number: pages.get(page_number, [])
         # Call the method for December 31st
         result_albums = album_methods_client._get_upcoming_releases_by_date(12, 31)
         assert len(result_albums) == 2
@@ -234,6 +335,93 @@ def test_get_upcoming_releases_by_date_next_month(album_methods_client):
         assert result_albums[1].release_date == "Dec 31"
 
 
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_get_upcoming_releases_by_date_skips_earlier_pages(mock_get_page, album_methods_client):
+    """Test that pages ending before the target date are skipped rather than scanned."""
+    # Page n holds albums released on Mar n; the target date is on page 11
+    mock_get_page.side_effect = lambda page_number: [
+        Album(f"Album {page_number}-{i}", "Artist", f"Mar {page_number}") for i in range(3)
+    ] + [Album(f"Album {page_number}-last", "Artist", f"Mar {page_number + 1}")]
+
+    result_albums = album_methods_client._get_upcoming_releases_by_date(3, 11)
+
+    assert [album.name for album in result_albums] == [
+        "Album 10-last", "Album 11-0", "Album 11-1", "Album 11-2",
+    ]
+    fetched_pages = sorted(call.args[0] for call in mock_get_page.call_args_list)
+    # Probes 1, 2, 4, 8 and 16 (ends after Mar 11), then scans one batch from page 9
+    assert fetched_pages == [1, 2, 4, 8, 9, 10, 11, 16]
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_get_upcoming_releases_by_date_reuses_probed_page(mock_get_page, album_methods_client):
+    """Test that the first page is not fetched twice when it already holds the target date."""
+    pages = {
+        1: [
+            Album("Album A", "Artist A", "Dec 30"),
+            Album("Album B", "Artist B", "Dec 31"),
+            Album("Album C", "Artist C", "Jan 1"),
+        ],
+    }
+    mock_get_page.side_effect = lambda page_number: pages.get(page_number, [])
+
+    result_albums = album_methods_client._get_upcoming_releases_by_date(12, 31)
+
+    assert [album.name for album in result_albums] == ["Album B"]
+    # The date ends on the probed first page, so no later page is prefetched
+    assert [call.args[0] for call in mock_get_page.call_args_list] == [1]
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_get_upcoming_releases_by_date_probe_past_last_page(mock_get_page, album_methods_client):
+    """Test that a probe past the last page bounds the search instead of failing."""
+    # Ten pages, page n holds albums released on Mar n; later pages don't exist
+    def get_page(page_number):
+        if page_number > 10:
+            raise HTTPError("http://test.com", 404, "Not Found", {}, None)
+        return [Album(f"Album {page_number}-{i}", "Artist", f"Mar {page_number}") for i in range(2)] + [
+            Album(f"Album {page_number}-last", "Artist", f"Mar {page_number + 1}")
+        ]
+
+    mock_get_page.side_effect = get_page
+
+    result_albums = album_methods_client._get_upcoming_releases_by_date(3, 10)
+
+    assert [album.name for album in result_albums] == ["Album 9-last", "Album 10-0", "Album 10-1"]
+    assert album_methods_client._find_first_page_for_date(3, 10, {}) == 9
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_find_first_page_for_date_wraps_into_next_year(mock_get_page, album_methods_client):
+    """Test that dates earlier in the year than the first release are treated as next year."""
+    pages = {
+        1: [Album("Album A", "Artist A", "Dec 20"), Album("Album B", "Artist B", "Dec 31")],
+        2: [Album("Album C", "Artist C", "Jan 1"), Album("Album D", "Artist D", "Jan 9")],
+    }
+    mock_get_page.side_effect = lambda page_number: pages.get(page_number, [])
+
+    probed_pages = {}
+    assert album_methods_client._find_first_page_for_date(1, 5, probed_pages) == 2
+    assert probed_pages == pages
+    assert album_methods_client._find_first_page_for_date(12, 25, {}) == 1
+
+
+@pytest.mark.parametrize(
+    "release_date, expected",
+    [
+        ("Jan 5", (1, 5)),
+        ("Dec 31", (12, 31)),
+        ("TBA", None),
+        ("2027", None),
+        ("Soon 5", None),
+        ("Jan ?", None),
+    ],
+)
+def test_parse_release_date(album_methods_client, release_date, expected):
+    """Test converting upcoming release dates to (month, day) tuples."""
+    assert album_methods_client._parse_release_date(release_date) == expected
+
+
 # Test upcoming_releases_by_page (public method)
 @patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
 def test_upcoming_releases_by_page_public_success(mock_get_upcoming_releases_by_page, album_methods_client, mock_album_objects):
@@ -242,11 +430,11 @@ def test_upcoming_releases_by_page_public_success(mock_get_upcoming_releases_by_
     result_json = album_methods_client.upcoming_releases_by_page(1)
     result = json.loads(result_json)
     assert len(result["albums"]) == len(mock_album_objects)
-    assert json.loads(result["albums"][0]) == json.loads(mock_album_objects[0].to_JSON())
+    assert result["albums"][0] == json.loads(mock_album_objects[0].to_JSON())
     mock_get_upcoming_releases_by_page.assert_called_once_with(1)
 
 
-@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=Exception("Test error"))
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=PageLimitError("Test error"))
 def test_upcoming_releases_by_page_public_error(mock_get_upcoming_releases_by_page, album_methods_client):
     """Test error handling in the public method for fetching releases by page number."""
     result_json = album_methods_client.upcoming_releases_by_page(999)
@@ -256,6 +444,47 @@ def test_upcoming_releases_by_page_public_error(mock_get_upcoming_releases_by_pa
     mock_get_upcoming_releases_by_page.assert_called_once_with(999)
 
 
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=URLError("Network error"))
+def test_upcoming_releases_by_page_public_network_error(mock_get_upcoming_releases_by_page, album_methods_client):
+    """Test that a page that can't be fetched is reported as an error response."""
+    result = json.loads(album_methods_client.upcoming_releases_by_page(1))
+    assert result["error"] == "Page Limit Error"
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=IndexError("Missing album title"))
+def test_upcoming_releases_by_page_public_unexpected_error(mock_get_upcoming_releases_by_page, album_methods_client):
+    """Test that unexpected errors propagate instead of being reported as out of range."""
+    with pytest.raises(IndexError, match="Missing album title"):
+        album_methods_client.upcoming_releases_by_page(1)
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_upcoming_releases_by_page_dict(mock_get_upcoming_releases_by_page, album_methods_client, mock_album_objects):
+    """Test that the dict variant returns the Album objects without serializing them."""
+    mock_get_upcoming_releases_by_page.return_value = mock_album_objects
+    result = album_methods_client.upcoming_releases_by_page_dict(1)
+    assert result == {"albums": mock_album_objects}
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=PageLimitError("Test error"))
+def test_upcoming_releases_by_page_dict_error(mock_get_upcoming_releases_by_page, album_methods_client):
+    """Test that the dict variant returns the error dictionary."""
+    result = album_methods_client.upcoming_releases_by_page_dict(999)
+    assert result == {
+        "error": "Page Limit Error",
+        "message": "The page number requested is out of range.",
+    }
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_upcoming_releases_by_page_bytes(mock_get_upcoming_releases_by_page, album_methods_client, mock_album_objects):
+    """Test that the bytes variant returns the same JSON as the str method, encoded."""
+    mock_get_upcoming_releases_by_page.return_value = mock_album_objects
+    result = album_methods_client.upcoming_releases_by_page_bytes(1)
+    assert isinstance(result, bytes)
+    assert result.decode() == album_methods_client.upcoming_releases_by_page(1)
+
+
 # Test upcoming_releases_by_limit
 @patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
 def test_upcoming_releases_by_limit_less_than_page(mock_get_upcoming_releases_by_page, album_methods_client, mock_album_objects):
@@ -298,6 +527,21 @@ def test_upcoming_releases_by_limit_multiple_pages(mock_get_upcoming_releases_by
     mock_get_upcoming_releases_by_page.assert_any_call(3)
 
 
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_upcoming_releases_by_limit_keeps_page_order(mock_get_upcoming_releases_by_page, album_methods_client):
+    """Test that concurrently fetched pages are stitched back together in page order."""
+    mock_get_upcoming_releases_by_page.side_effect = lambda page_number: [
+        Album(f"Album {page_number}-{i}", "Artist", "Jan 1") for i in range(60)
+    ]
+
+    result = json.loads(album_methods_client.upcoming_releases_by_limit(130))
+    names = [album["name"] for album in result["albums"]]
+    assert len(names) == 130
+    assert names[0] == "Album 1-0"
+    assert names[60] == "Album 2-0"
+    assert names[-1] == "Album 3-9"
+
+
 @patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page', side_effect=Exception("Test error"))
 def test_upcoming_releases_by_limit_error(mock_get_upcoming_releases_by_page, album_methods_client):
     """Test error handling in upcoming_releases_by_limit."""
@@ -305,7 +549,15 @@ def test_upcoming_releases_by_limit_error(mock_get_upcoming_releases_by_page, al
     result = json.loads(result_json)
     assert result["error"] == "Page Limit Error"
     assert "Test error" in result["message"]  # Check for the exception message
-    mock_get_upcoming_releases_by_page.assert_called_once_with(1)  # Error happens on first page
+    mock_get_upcoming_releases_by_page.assert_any_call(1)  # Pages are fetched concurrently
+
+@pytest.mark.parametrize("total", [0, -5])
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_upcoming_releases_by_limit_non_positive(mock_get_upcoming_releases_by_page, album_methods_client, total):
+    """Test that a zero or negative total returns no albums without fetching pages."""
+    result = json.loads(album_methods_client.upcoming_releases_by_limit(total))
+    assert result == {"albums": []}
+    mock_get_upcoming_releases_by_page.assert_not_called()
 
 # Test upcoming_releases_by_date (public method)
 @patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_date')
@@ -315,7 +567,7 @@ def test_upcoming_releases_by_date_public_success(mock_get_upcoming_releases_by_
     result_json = album_methods_client.upcoming_releases_by_date(1, 1)
     result = json.loads(result_json)
     assert len(result["albums"]) == len(mock_album_objects)
-    assert json.loads(result["albums"][0]) == json.loads(mock_album_objects[0].to_JSON())
+    assert result["albums"][0] == json.loads(mock_album_objects[0].to_JSON())
     mock_get_upcoming_releases_by_date.assert_called_once_with(1, 1)
 
 
@@ -347,3 +599,22 @@ def test_upcoming_albums_date_tomorrow_scenario(album_methods_client, mock_album
         assert len(albums["albums"]) < 60  # Original assertion still holds
         mock_get_date.assert_called_once_with(tomorrow_month, tomorrow_day)
         
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_date')
+def test_upcoming_releases_by_date_dict_and_bytes(mock_get_upcoming_releases_by_date, album_methods_client, mock_album_objects):
+    """Test the dict and bytes variants of the public method for fetching releases by date."""
+    mock_get_upcoming_releases_by_date.return_value = mock_album_objects
+    assert album_methods_client.upcoming_releases_by_date_dict(1, 1) == {"albums": mock_album_objects}
+    result = json.loads(album_methods_client.upcoming_releases_by_date_bytes(1, 1))
+    assert result["albums"][0] == json.loads(mock_album_objects[0].to_JSON())
+
+
+@patch('albumoftheyearapi.album.AlbumMethods._get_upcoming_releases_by_page')
+def test_upcoming_releases_by_limit_dict_and_bytes(mock_get_upcoming_releases_by_page, album_methods_client, mock_album_objects):
+    """Test the dict and bytes variants of upcoming_releases_by_limit."""
+    mock_get_upcoming_releases_by_page.return_value = mock_album_objects * 30
+    result = album_methods_client.upcoming_releases_by_limit_dict(10)
+    assert len(result["albums"]) == 10
+    assert isinstance(result["albums"][0], Album)
+    assert len(json.loads(album_methods_client.upcoming_releases_by_limit_bytes(10))["albums"]) == 10
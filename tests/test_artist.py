@@ -1,13 +1,79 @@
 import json
 import datetime
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 
 # Import the classes directly from album.py for unit testing
-from albumoftheyearapi import AOTY
+from albumoftheyearapi import AOTY, artist, session
 from albumoftheyearapi.artist import ArtistMethods
 from bs4 import BeautifulSoup # Import BeautifulSoup for mock setup
 
+# Mock HTML content for an artist page.
+# This HTML is designed to cover all parsing needs for discography,
+# scores, details, top songs, and similar artists.
+MOCK_ARTIST_PAGE_HTML = """
+<html>
+<body>
+    <div class="artistHeadline">Kanye West</div>
+    <div class="artistCriticScore">85</div>
+    <div class="artistUserScore">75</div>
+    <div class="followCount">123,456</div>
+    <div class="artistTopBox info">Some artist details here.</div>
+
+    <h2>Albums</h2>
+    <div class="albumBlock">
+        <div class="albumTitle">The College Dropout</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+    <div class="albumBlock">
+        <div class="albumTitle">Late Registration</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+
+    <h2>Mixtapes</h2>
+    <div class="albumBlock">
+        <div class="albumTitle">Freshmen Adjustment</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+
+    <h2>EPs</h2>
+    <div class="albumBlock">
+        <div class="albumTitle">808s & Heartbreak (EP)</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+
+    <h2>SinglesView All</h2>
+    <div class="albumBlock">
+        <div class="albumTitle">Stronger</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+    <div class="albumBlock">
+        <div class="albumTitle">Gold Digger</div>
+        <div class="artistTitle">Kanye West</div>
+    </div>
+
+    <h2>Top Songs</h2>
+    <table>
+        <tr>
+            <td class="songAlbum"><a>Runaway</a></td>
+        </tr>
+        <tr>
+            <td class="songAlbum"><a>Jesus Walks</a></td>
+        </tr>
+    </table>
+
+    <h2>Similar Artists</h2>
+    <div class="albumBlock">
+        <div class="name">Jay-Z</div>
+    </div>
+    <div class="albumBlock">
+        <div class="name">Kid Cudi</div>
+    </div>
+</body>
+</html>
+"""
+
 # --- Fixtures ---
 
 @pytest.fixture
@@ -25,92 +91,43 @@ def artist_methods_client():
     """Fixture to provide an instance of ArtistMethods."""
     return ArtistMethods()
 
-@pytest.fixture
-def mock_artist_page_html():
-    """Fixture to provide mock HTML content for an artist page.
-    This HTML is designed to cover all parsing needs for discography,
-    scores, details, top songs, and similar artists.
-    """
-    return """
-    <html>
-    <body>
-        <div class="artistHeadline">Kanye West</div>
-        <div class="artistCriticScore">85</div>
-        <div class="artistUserScore">75</div>
-        <div class="followCount">123,456</div>
-        <div class="artistTopBox info">Some artist details here.</div>
-
-        <h2>Albums</h2>
-        <div class="albumBlock">
-            <div class="albumTitle">The College Dropout</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-        <div class="albumBlock">
-            <div class="albumTitle">Late Registration</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-
-        <h2>Mixtapes</h2>
-        <div class="albumBlock">
-            <div class="albumTitle">Freshmen Adjustment</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-
-        <h2>EPs</h2>
-        <div class="albumBlock">
-            <div class="albumTitle">808s & Heartbreak (EP)</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-
-        <h2>SinglesView All</h2>
-        <div class="albumBlock">
-            <div class="albumTitle">Stronger</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-        <div class="albumBlock">
-            <div class="albumTitle">Gold Digger</div>
-            <div class="artistTitle">Kanye West</div>
-        </div>
-
-        <h2>Top Songs</h2>
-        <table>
-            <tr>
-                <td class="songAlbum"><a>Runaway</a></td>
-            </tr>
-            <tr>
-                <td class="songAlbum"><a>Jesus Walks</a></td>
-            </tr>
-        </table>
-
-        <h2>Similar Artists</h2>
-        <div class="albumBlock">
-            <div class="name">Jay-Z</div>
-        </div>
-        <div class="albumBlock">
-            <div class="name">Kid Cudi</div>
-        </div>
-    </body>
-    </html>
+@pytest.fixture(scope="session")
+def mock_artist_page_soup():
+    """Fixture to provide the mock artist page, parsed once for the whole session.
+    The artist methods only read from the soup, so every test can share it.
     """
+    return BeautifulSoup(MOCK_ARTIST_PAGE_HTML, "lxml")
 
-# --- Mocking the web scraping for all subsequent tests ---
-# This fixture will run for every test and mock urlopen and BeautifulSoup
-@pytest.fixture(autouse=True)
-def mock_web_requests(mock_artist_page_html):
+@pytest.fixture(scope="session")
+def mock_artist_page_bytes():
+    """Fixture to provide the mock artist page encoded once for the whole session."""
+    return MOCK_ARTIST_PAGE_HTML.encode('utf-8')
+
+# --- Mocking the web scraping ---
+@pytest.fixture(scope="module")
+def artist_page_mocks(mock_artist_page_bytes, mock_artist_page_soup):
+    """
+    Provides stand-ins for fetch_page and BeautifulSoup, built once per module.
+    """
+    # BeautifulSoup returns a real soup parsed from the mock HTML so the internal parsing
+    # methods (__get_discography, __get_community_data) work as expected. Plain Mocks
+    # are enough here and skip building MagicMock's magic methods.
+    return SimpleNamespace(
+        fetch_page=Mock(return_value=mock_artist_page_bytes),
+        BeautifulSoup=Mock(return_value=mock_artist_page_soup),
+    )
+
+# Tests that load an artist page opt into this fixture
+@pytest.fixture
+def mocked_web(artist_page_mocks):
     """
-    Mocks urllib.request.urlopen and BeautifulSoup to prevent actual web requests.
-    It provides a BeautifulSoup object parsed from mock HTML to the ArtistMethods instance.
+    Mocks fetch_page and BeautifulSoup to prevent actual web requests, for the current
+    test only. Provides the mocked fetch_page with its call count cleared.
     """
-    with patch('albumoftheyearapi.artist.urlopen') as mock_urlopen, \
-         patch('albumoftheyearapi.artist.BeautifulSoup') as mock_bs:
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_artist_page_html.encode('utf-8')
-        mock_urlopen.return_value = mock_response
-        
-        # Configure BeautifulSoup to return a real BeautifulSoup object parsed from mock HTML
-        # This allows the internal parsing methods (__get_discography, __get_community_data) to work as expected
-        mock_bs.return_value = BeautifulSoup(mock_artist_page_html, "html.parser")
-        yield # Allow tests to run
+    artist_page_mocks.fetch_page.reset_mock()
+    with patch.object(artist, "fetch_page", artist_page_mocks.fetch_page), \
+         patch.object(artist, "BeautifulSoup", artist_page_mocks.BeautifulSoup):
+        yield artist_page_mocks.fetch_page
 
 # --- Tests for AOTY client initialization ---
 def test_aoty_client_initialization(aoty_client):
@@ -126,91 +143,46 @@ def test_artist_methods_initialization(artist_methods_client):
     assert artist_methods_client.url == ""
     assert artist_methods_client.artist_url == "https://www.albumoftheyear.org/artist/"
     assert artist_methods_client.albums == [] # Should be empty initially before any method call
+    assert len(artist_methods_client.artist_page_cache) == 0
+
+def test_artist_url(artist_methods_client):
+    """Test that artist page URLs are built from the base artist URL."""
+    assert artist_methods_client._artist_url("183-kanye-west") == (
+        "https://www.albumoftheyear.org/artist/183-kanye-west/"
+    )
 
 # --- Tests for ArtistMethods public methods ---
 
-def test_get_artist_albums(aoty_client, artist_id):
-    """Test fetching artist albums."""
-    artist_albums = aoty_client.artist_albums(artist_id)
-    assert artist_albums is not None
-    assert isinstance(artist_albums, list)
-    assert "The College Dropout" in artist_albums
-    assert "Late Registration" in artist_albums
-    assert len(artist_albums) == 2 # Based on mock HTML
-
-def test_get_artist_albums_json(aoty_client, artist_id):
-    """Test fetching artist albums in JSON format."""
-    artist_albums_json = aoty_client.artist_albums_json(artist_id)
-    assert artist_albums_json is not None
-    data = json.loads(artist_albums_json)
-    assert "albums" in data
-    assert isinstance(data["albums"], list)
-    assert "The College Dropout" in data["albums"]
-    assert "Late Registration" in data["albums"]
-    assert len(data["albums"]) == 2
-
-def test_get_artist_mixtapes(aoty_client, artist_id):
-    """Test fetching artist mixtapes."""
-    artist_mixtapes = aoty_client.artist_mixtapes(artist_id)
-    assert artist_mixtapes is not None
-    assert isinstance(artist_mixtapes, list)
-    assert "Freshmen Adjustment" in artist_mixtapes
-    assert len(artist_mixtapes) == 1
-
-def test_get_artist_mixtapes_json(aoty_client, artist_id):
-    """Test fetching artist mixtapes in JSON format."""
-    artist_mixtapes_json = aoty_client.artist_mixtapes_json(artist_id)
-    assert artist_mixtapes_json is not None
-    data = json.loads(artist_mixtapes_json)
-    assert "mixtapes" in data
-    assert isinstance(data["mixtapes"], list)
-    assert "Freshmen Adjustment" in data["mixtapes"]
-    assert len(data["mixtapes"]) == 1
-
-def test_get_artist_eps(aoty_client, artist_id):
-    """Test fetching artist EPs."""
-    artist_eps = aoty_client.artist_eps(artist_id)
-    assert artist_eps is not None
-    assert isinstance(artist_eps, list)
-    assert "808s & Heartbreak (EP)" in artist_eps
-    assert len(artist_eps) == 1
-
-def test_get_artist_eps_json(aoty_client, artist_id):
-    """Test fetching artist EPs in JSON format."""
-    artist_eps_json = aoty_client.artist_eps_json(artist_id)
-    assert artist_eps_json is not None
-    data = json.loads(artist_eps_json)
-    assert "eps" in data
-    assert isinstance(data["eps"], list)
-    assert "808s & Heartbreak (EP)" in data["eps"]
-    assert len(data["eps"]) == 1
-
-def test_get_artist_singles(aoty_client, artist_id):
-    """Test fetching artist singles."""
-    artist_singles = aoty_client.artist_singles(artist_id)
-    assert artist_singles is not None
-    assert isinstance(artist_singles, list)
-    assert "Stronger" in artist_singles
-    assert "Gold Digger" in artist_singles
-    assert len(artist_singles) == 2
-
-def test_get_artist_singles_json(aoty_client, artist_id):
-    """Test fetching artist singles in JSON format."""
-    artist_singles_json = aoty_client.artist_singles_json(artist_id)
-    assert artist_singles_json is not None
-    data = json.loads(artist_singles_json)
-    assert "singles" in data
-    assert isinstance(data["singles"], list)
-    assert "Stronger" in data["singles"]
-    assert "Gold Digger" in data["singles"]
-    assert len(data["singles"]) == 2
-
-def test_get_artist_name(aoty_client, artist_id):
+# Discography methods, the JSON key they serialize under and their releases in the mock HTML
+DISCOGRAPHY_CASES = [
+    ("artist_albums", "albums", ["The College Dropout", "Late Registration"]),
+    ("artist_mixtapes", "mixtapes", ["Freshmen Adjustment"]),
+    ("artist_eps", "eps", ["808s & Heartbreak (EP)"]),
+    ("artist_singles", "singles", ["Stronger", "Gold Digger"]),
+]
+
+@pytest.mark.parametrize("method_name, key, expected_items", DISCOGRAPHY_CASES)
+def test_get_artist_discography(aoty_client, artist_id, mocked_web, method_name, key, expected_items):
+    """Test fetching each category of an artist's discography."""
+    items = getattr(aoty_client, method_name)(artist_id)
+    assert isinstance(items, list)
+    assert items == expected_items # Based on mock HTML
+
+@pytest.mark.parametrize("method_name, key, expected_items", DISCOGRAPHY_CASES)
+def test_get_artist_discography_json(aoty_client, artist_id, mocked_web, method_name, key, expected_items):
+    """Test fetching each category of an artist's discography in JSON format."""
+    items_json = getattr(aoty_client, f"{method_name}_json")(artist_id)
+    assert items_json is not None
+    data = json.loads(items_json)
+    assert key in data
+    assert data[key] == expected_items
+
+def test_get_artist_name(aoty_client, artist_id, mocked_web):
     """Test fetching artist name."""
     artist_name = aoty_client.artist_name(artist_id)
     assert artist_name == "Kanye West"
 
-def test_get_artist_name_json(aoty_client, artist_id):
+def test_get_artist_name_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist name in JSON format."""
     artist_name_json = aoty_client.artist_name_json(artist_id)
     assert artist_name_json is not None
@@ -218,12 +190,12 @@ def test_get_artist_name_json(aoty_client, artist_id):
     assert "name" in data
     assert data["name"] == "Kanye West"
 
-def test_get_artist_critic_score(aoty_client, artist_id):
+def test_get_artist_critic_score(aoty_client, artist_id, mocked_web):
     """Test fetching artist critic score."""
     artist_critic_score = aoty_client.artist_critic_score(artist_id)
     assert artist_critic_score == "85"
 
-def test_get_artist_critic_score_json(aoty_client, artist_id):
+def test_get_artist_critic_score_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist critic score in JSON format."""
     artist_critic_score_json = aoty_client.artist_critic_score_json(artist_id)
     assert artist_critic_score_json is not None
@@ -231,12 +203,12 @@ def test_get_artist_critic_score_json(aoty_client, artist_id):
     assert "critic score" in data
     assert data["critic score"] == "85"
 
-def test_get_artist_user_score(aoty_client, artist_id):
+def test_get_artist_user_score(aoty_client, artist_id, mocked_web):
     """Test fetching artist user score."""
     artist_user_score = aoty_client.artist_user_score(artist_id)
     assert artist_user_score == "75"
 
-def test_get_artist_user_score_json(aoty_client, artist_id):
+def test_get_artist_user_score_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist user score in JSON format."""
     artist_user_score_json = aoty_client.artist_user_score_json(artist_id)
     assert artist_user_score_json is not None
@@ -244,12 +216,12 @@ def test_get_artist_user_score_json(aoty_client, artist_id):
     assert "user score" in data
     assert data["user score"] == "75"
 
-def test_get_artist_total_score(aoty_client, artist_id):
+def test_get_artist_total_score(aoty_client, artist_id, mocked_web):
     """Test calculating artist total score."""
     artist_total_score = aoty_client.artist_total_score(artist_id)
     assert artist_total_score == 80.0 # (85 + 75) / 2
 
-def test_get_artist_total_score_json(aoty_client, artist_id):
+def test_get_artist_total_score_json(aoty_client, artist_id, mocked_web):
     """Test calculating artist total score in JSON format."""
     artist_total_score_json = aoty_client.artist_total_score_json(artist_id)
     assert artist_total_score_json is not None
@@ -257,12 +229,12 @@ def test_get_artist_total_score_json(aoty_client, artist_id):
     assert "total score" in data
     assert data["total score"] == 80.0
 
-def test_get_artist_follower_count(aoty_client, artist_id):
+def test_get_artist_follower_count(aoty_client, artist_id, mocked_web):
     """Test fetching artist follower count."""
     artist_follower_count = aoty_client.artist_follower_count(artist_id)
     assert artist_follower_count == "123,456"
 
-def test_get_artist_follower_count_json(aoty_client, artist_id):
+def test_get_artist_follower_count_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist follower count in JSON format."""
     artist_follower_count_json = aoty_client.artist_follower_count_json(artist_id)
     assert artist_follower_count_json is not None
@@ -270,12 +242,12 @@ def test_get_artist_follower_count_json(aoty_client, artist_id):
     assert "follower count" in data
     assert data["follower count"] == "123,456"
 
-def test_get_artist_details(aoty_client, artist_id):
+def test_get_artist_details(aoty_client, artist_id, mocked_web):
     """Test fetching artist details."""
     artist_details = aoty_client.artist_details(artist_id)
     assert artist_details == "Some artist details here."
 
-def test_get_artist_details_json(aoty_client, artist_id):
+def test_get_artist_details_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist details in JSON format."""
     artist_details_json = aoty_client.artist_details_json(artist_id)
     assert artist_details_json is not None
@@ -283,7 +255,7 @@ def test_get_artist_details_json(aoty_client, artist_id):
     assert "artist details" in data
     assert data["artist details"] == "Some artist details here."
 
-def test_get_artist_top_songs(aoty_client, artist_id):
+def test_get_artist_top_songs(aoty_client, artist_id, mocked_web):
     """Test fetching artist top songs."""
     artist_top_songs = aoty_client.artist_top_songs(artist_id)
     assert artist_top_songs is not None
@@ -292,7 +264,7 @@ def test_get_artist_top_songs(aoty_client, artist_id):
     assert "Jesus Walks" in artist_top_songs
     assert len(artist_top_songs) == 2
 
-def test_get_artist_top_songs_json(aoty_client, artist_id):
+def test_get_artist_top_songs_json(aoty_client, artist_id, mocked_web):
     """Test fetching artist top songs in JSON format."""
     artist_top_songs_json = aoty_client.artist_top_songs_json(artist_id)
     assert artist_top_songs_json is not None
@@ -303,7 +275,7 @@ def test_get_artist_top_songs_json(aoty_client, artist_id):
     assert "Jesus Walks" in data["top songs"]
     assert len(data["top songs"]) == 2
 
-def test_get_similar_artists(aoty_client, artist_id):
+def test_get_similar_artists(aoty_client, artist_id, mocked_web):
     """Test fetching similar artists."""
     similar_artists = aoty_client.similar_artists(artist_id)
     assert similar_artists is not None
@@ -312,7 +284,7 @@ def test_get_similar_artists(aoty_client, artist_id):
     assert "Kid Cudi" in similar_artists
     assert len(similar_artists) == 2
 
-def test_get_similar_artists_json(aoty_client, artist_id):
+def test_get_similar_artists_json(aoty_client, artist_id, mocked_web):
     """Test fetching similar artists in JSON format."""
     similar_artists_json = aoty_client.similar_artists_json(artist_id)
     assert similar_artists_json is not None
@@ -323,9 +295,96 @@ def test_get_similar_artists_json(aoty_client, artist_id):
     assert "Kid Cudi" in data["similar artists"]
     assert len(data["similar artists"]) == 2
     
-def test_functions_without_wrapper(artist_methods_client, artist_id):
+def test_functions_without_wrapper(artist_methods_client, artist_id, mocked_web):
     """Test a single function directly using ArtistMethods without the main AOTY wrapper."""
-    # This test should also be mocked by the autouse fixture
     albums = artist_methods_client.artist_albums(artist_id)
     assert albums is not None
     assert "The College Dropout" in albums
+
+def test_artist_page_fetched_once_for_many_fields(aoty_client, artist_id, mocked_web):
+    """Test that reading several fields of one artist fetches the page only once."""
+    aoty_client.artist_albums(artist_id)
+    aoty_client.artist_total_score(artist_id)
+    aoty_client.artist_name(artist_id)
+    aoty_client.similar_artists(artist_id)
+    assert mocked_web.call_count == 1
+
+def test_artist_page_cache_reused_when_switching_artists(aoty_client, artist_id, mocked_web):
+    """Test that switching back to a previously loaded artist is served from the cache."""
+    aoty_client.artist_albums(artist_id)
+    aoty_client.artist_albums("3-radiohead")
+    albums = aoty_client.artist_albums(artist_id)
+    assert mocked_web.call_count == 2
+    assert aoty_client.url == aoty_client.artist_url + artist_id + "/"
+    assert "The College Dropout" in albums
+
+def test_artist_page_cache_is_bounded(artist_methods_client, mocked_web):
+    """Test that the least recently used artist page is dropped once the cache is full."""
+    with patch('albumoftheyearapi.artist.ARTIST_PAGE_CACHE_SIZE', 2):
+        artist_methods_client.artist_albums("1-first")
+        artist_methods_client.artist_albums("2-second")
+        artist_methods_client.artist_albums("1-first")
+        artist_methods_client.artist_albums("3-third")
+    cached_urls = list(artist_methods_client.artist_page_cache)
+    assert cached_urls == [
+        artist_methods_client.artist_url + "1-first/",
+        artist_methods_client.artist_url + "3-third/",
+    ]
+
+def test_artist_top_box_read_in_one_pass(aoty_client, artist_id, mocked_web):
+    """Test that all top box fields are extracted when the page is loaded."""
+    aoty_client.artist_name(artist_id)
+    assert aoty_client.top_box == {
+        "artistHeadline": "Kanye West",
+        "artistCriticScore": "85",
+        "artistUserScore": "75",
+        "followCount": "123,456",
+        "artistTopBox info": "Some artist details here.",
+    }
+
+def test_discography_ignores_titles_outside_their_category(artist_methods_client, mocked_web):
+    """Test that titles before the first heading and names outside Similar Artists are skipped."""
+    html = """
+    <div class="albumBlock"><div class="albumTitle">Before Any Heading</div></div>
+    <h2>Albums</h2>
+    <div class="albumBlock"><div class="albumTitle">Donda</div><div class="name">Not An Album</div></div>
+    <h2>Mixtapes</h2>
+    <h2>EPs</h2>
+    <h2>SinglesView All</h2>
+    <h2>Similar Artists</h2>
+    <div class="albumBlock"><div class="name">Jay-Z</div><div class="albumTitle">Not An Artist</div></div>
+    """
+    with patch('albumoftheyearapi.artist.BeautifulSoup', return_value=BeautifulSoup(html, "lxml")):
+        assert artist_methods_client.artist_albums("1-other") == ["Donda"]
+        assert artist_methods_client.artist_mixtapes("1-other") == []
+        assert artist_methods_client.similar_artists("1-other") == ["Jay-Z"]
+
+def test_artist_page_strained_parse(artist_methods_client, artist_id, mock_artist_page_bytes):
+    """Test that the real strained lxml parse of an artist page still finds every field."""
+    with patch('albumoftheyearapi.artist.fetch_page', return_value=mock_artist_page_bytes), \
+         patch('albumoftheyearapi.artist.BeautifulSoup', BeautifulSoup):
+        assert artist_methods_client.artist_albums(artist_id) == ["The College Dropout", "Late Registration"]
+        assert artist_methods_client.artist_mixtapes(artist_id) == ["Freshmen Adjustment"]
+        assert artist_methods_client.artist_eps(artist_id) == ["808s & Heartbreak (EP)"]
+        assert artist_methods_client.artist_singles(artist_id) == ["Stronger", "Gold Digger"]
+        assert artist_methods_client.similar_artists(artist_id) == ["Jay-Z", "Kid Cudi"]
+        assert artist_methods_client.artist_top_songs(artist_id) == ["Runaway", "Jesus Walks"]
+        assert artist_methods_client.top_box == {
+            "artistHeadline": "Kanye West",
+            "artistCriticScore": "85",
+            "artistUserScore": "75",
+            "followCount": "123,456",
+            "artistTopBox info": "Some artist details here.",
+        }
+    # Only the strained tags were kept from the page
+    assert artist_methods_client.artist_page.find("body") is None
+    assert artist_methods_client.artist_page.find("table") is None
+
+def test_web_mocks_only_apply_to_opted_in_tests(mocked_web):
+    """Test that the opted-in fixture patches the module while the test runs."""
+    assert artist.fetch_page is mocked_web
+
+def test_web_mocks_not_active_without_opting_in():
+    """Test that tests which don't request mocked_web see the real fetch and parser."""
+    assert artist.fetch_page is session.fetch_page
+    assert artist.BeautifulSoup is BeautifulSoup
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from albumoftheyearapi import AOTY, AsyncAOTY
+
+
+@pytest.fixture
+def async_client():
+    """Fixture to provide an instance of AsyncAOTY."""
+    return AsyncAOTY()
+
+
+def test_async_client_exposes_coroutines(async_client):
+    """Test that public AOTY methods are exposed as coroutine functions."""
+    assert asyncio.iscoroutinefunction(async_client.artist_albums)
+    assert async_client.artist_albums.__doc__ == AOTY.artist_albums.__doc__
+
+
+@pytest.mark.parametrize("name", ["_client_missing", "artist_url", "does_not_exist"])
+def test_async_client_rejects_non_methods(async_client, name):
+    """Test that private names and plain attributes are not proxied."""
+    with pytest.raises(AttributeError):
+        getattr(async_client, name)
+
+
+@patch('albumoftheyearapi.client.AOTY.artist_albums')
+def test_async_client_gathers_calls(mock_artist_albums, async_client):
+    """Test that gathered calls return results in order, each on a worker thread."""
+    main_thread = threading.get_ident()
+    threads = []
+
+    def fake_artist_albums(artist):
+        threads.append(threading.get_ident())
+        return [f"{artist} album"]
+
+    mock_artist_albums.side_effect = fake_artist_albums
+
+    async def gather():
+        return await asyncio.gather(
+            *[async_client.artist_albums(artist) for artist in ("a", "b", "c")]
+        )
+
+    result = asyncio.run(gather())
+
+    assert result == [["a album"], ["b album"], ["c album"]]
+    assert main_thread not in threads
+
+
+def test_async_client_uses_one_aoty_client_per_thread(async_client):
+    """Test that each worker thread reuses its own AOTY client."""
+    assert async_client._client() is async_client._client()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(async_client._client()))
+    thread.start()
+    thread.join()
+    assert other[0] is not async_client._client()
+
+
+@patch('albumoftheyearapi.client.AOTY.user_liked_music', return_value=["Artist: Album"])
+@patch('albumoftheyearapi.client.AOTY.user_perfect_scores', return_value="Perfect Album")
+@patch('albumoftheyearapi.client.AOTY.user_rating_distribution', return_value=["1"] * 11)
+@patch('albumoftheyearapi.client.AOTY._load_profile')
+def test_async_client_user_full_profile(
+    mock_load_profile, mock_distribution, mock_perfect_scores, mock_liked_music, async_client
+):
+    """Test that the full profile combines the three user pages."""
+    mock_load_profile.return_value = {"ratings": "123", "about": "Hi"}
+
+    result = asyncio.run(async_client.user_full_profile("doublez"))
+
+    assert result == {
+        "ratings": "123",
+        "about": "Hi",
+        "rating_distribution": ["1"] * 11,
+        "perfect_scores": "Perfect Album",
+        "liked_music": ["Artist: Album"],
+    }
+    assert mock_load_profile.return_value == {"ratings": "123", "about": "Hi"}  # Cached profile untouched
+    mock_perfect_scores.assert_called_once_with("doublez")
+    mock_liked_music.assert_called_once_with("doublez")
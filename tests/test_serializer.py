@@ -0,0 +1,44 @@
+import json
+
+from albumoftheyearapi.album import Album
+from albumoftheyearapi.serializer import dumps, dumps_bytes
+
+
+def test_dumps_returns_str():
+    """Test that dumps returns a JSON string rather than bytes."""
+    result = dumps({"albums": ["Donda"]})
+    assert isinstance(result, str)
+    assert json.loads(result) == {"albums": ["Donda"]}
+
+
+def test_dumps_serializes_albums():
+    """Test that Album dataclasses are serialized natively."""
+    result = dumps([Album("Album X", "Artist X", "Mar 10")])
+    assert json.loads(result) == [
+        {"name": "Album X", "artist": "Artist X", "release_date": "Mar 10"}
+    ]
+
+
+def test_dumps_uses_default_for_unknown_objects():
+    """Test that dumps falls back to the default callable for custom objects."""
+    result = dumps({"tags": {"rap"}}, default=list)
+    assert json.loads(result) == {"tags": ["rap"]}
+
+
+def test_dumps_sort_keys():
+    """Test that dumps sorts dictionary keys when asked to."""
+    assert dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+    assert dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+
+
+def test_dumps_keeps_non_ascii_text():
+    """Test that non-ASCII text is emitted as UTF-8 and round-trips."""
+    result = dumps({"name": "Björk"})
+    assert json.loads(result) == {"name": "Björk"}
+
+
+def test_dumps_bytes_returns_utf8_bytes():
+    """Test that dumps_bytes returns the encoded form of dumps."""
+    result = dumps_bytes({"name": "Björk"}, sort_keys=True)
+    assert isinstance(result, bytes)
+    assert result == dumps({"name": "Björk"}, sort_keys=True).encode("utf-8")
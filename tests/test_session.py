@@ -0,0 +1,138 @@
+import gzip
+import io
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+import pytest
+import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
+
+from albumoftheyearapi import session
+from albumoftheyearapi.session import fetch_page, CachedPage, PageCache, POOL, HEADERS
+
+
+def response_stub(status, data=b"", headers=None, reason=""):
+    """Builds a plain stand-in for the urllib3 response fetch_page reads."""
+    return SimpleNamespace(status=status, data=data, headers=headers or {}, reason=reason)
+
+
+def test_pool_sends_user_agent():
+    """Test that the shared pool sends the User-Agent header with every request."""
+    assert POOL.headers["User-Agent"] == HEADERS["User-Agent"]
+
+
+def test_pool_requests_compressed_responses():
+    """Test that the shared pool asks the server for every encoding urllib3 can decode."""
+    encodings = POOL.headers["Accept-Encoding"].split(",")
+    assert {"gzip", "deflate"} <= set(encodings)
+    assert POOL.headers["Accept-Encoding"] == ACCEPT_ENCODING
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_success(mock_pool):
+    """Test that fetch_page returns the raw body of a successful response."""
+    mock_pool.request.return_value = response_stub(200, data=b"<html>mock html</html>")
+
+    assert fetch_page("http://test.com") == b"<html>mock html</html>"
+    mock_pool.request.assert_called_once_with(
+        "GET", "http://test.com", headers=HEADERS, decode_content=True
+    )
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_decompresses_gzip(mock_pool):
+    """Test that a gzip encoded page is returned decompressed."""
+    mock_pool.request.return_value = urllib3.HTTPResponse(
+        body=io.BytesIO(gzip.compress(b"<html>mock html</html>")),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+    )
+
+    assert fetch_page("http://test.com") == b"<html>mock html</html>"
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_http_error(mock_pool):
+    """Test that an HTTP error status is raised as urllib's HTTPError."""
+    mock_pool.request.return_value = response_stub(404, reason="Not Found")
+
+    with pytest.raises(HTTPError) as excinfo:
+        fetch_page("http://test.com")
+    assert excinfo.value.code == 404
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_network_error(mock_pool):
+    """Test that a connection error surviving the retries is raised as URLError."""
+    mock_pool.request.side_effect = urllib3.exceptions.MaxRetryError(None, "http://test.com")
+
+    with pytest.raises(URLError):
+        fetch_page("http://test.com")
+
+
+@pytest.fixture
+def page_cache(tmp_path):
+    """Fixture to enable the page cache in a temporary directory."""
+    yield session.enable_page_cache(str(tmp_path))
+    session.disable_page_cache()
+
+
+def test_page_cache_round_trip(tmp_path):
+    """Test that a stored page is read back with its validators."""
+    cache = PageCache(str(tmp_path))
+    cache.set("http://test.com", CachedPage(b"<html>\n</html>", '"abc"', None, 1.0))
+
+    assert cache.get("http://test.com") == CachedPage(b"<html>\n</html>", '"abc"', None, 1.0)
+    assert cache.get("http://other.com") is None
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_stores_page_with_validators(mock_pool, page_cache):
+    """Test that pages with an ETag are stored in the cache."""
+    mock_pool.request.return_value = response_stub(
+        200, data=b"<html>mock html</html>", headers={"ETag": '"abc"'}
+    )
+
+    assert fetch_page("http://test.com") == b"<html>mock html</html>"
+    cached_page = page_cache.get("http://test.com")
+    assert cached_page.body == b"<html>mock html</html>"
+    assert cached_page.etag == '"abc"'
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_revalidates_cached_page(mock_pool, page_cache):
+    """Test that a cached page is revalidated and reused on a 304 response."""
+    page_cache.set(
+        "http://test.com",
+        CachedPage(b"<html>cached</html>", '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT", 0.0),
+    )
+    mock_pool.request.return_value = response_stub(304)
+
+    assert fetch_page("http://test.com") == b"<html>cached</html>"
+    headers = mock_pool.request.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert headers["User-Agent"] == HEADERS["User-Agent"]
+    assert page_cache.get("http://test.com").stored_at > 0.0
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_serves_fresh_page_without_request(mock_pool, page_cache):
+    """Test that pages younger than max_age are served without a request."""
+    page_cache.max_age = 60
+    page_cache.set("http://test.com", CachedPage(b"<html>cached</html>", stored_at=time.time()))
+
+    assert fetch_page("http://test.com") == b"<html>cached</html>"
+    mock_pool.request.assert_not_called()
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_fetch_page_skips_pages_without_validators(mock_pool, page_cache):
+    """Test that pages that can't be revalidated aren't stored when max_age is 0."""
+    mock_pool.request.return_value = response_stub(200, data=b"<html></html>")
+
+    fetch_page("http://test.com")
+    assert page_cache.get("http://test.com") is None
@@ -0,0 +1,20 @@
+import pytest
+
+from albumoftheyearapi.text import strip_non_ascii
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("  Donda  ", "Donda"),
+        ("Beyoncé", "Beyonce"),
+        ("  é Title ", "e Title"),
+        ("ñ", "n"),
+        ("ﬁve", "five"),
+        ("日本", ""),
+        ("Sigur Rós – ( )", "Sigur Ros  ( )"),
+    ],
+)
+def test_strip_non_ascii(text, expected):
+    """Test that titles are stripped, accents folded and other non-ASCII characters dropped."""
+    assert strip_non_ascii(text) == expected
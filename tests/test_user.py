@@ -1,14 +1,37 @@
 import json
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 
-from albumoftheyearapi.user import UserMethods, BeautifulSoup
+from albumoftheyearapi import session
+from albumoftheyearapi.user import (
+    ALBUM_BLOCK_STRAINER,
+    PROFILE_PAGE_STRAINER,
+    RATING_DISTRIBUTION_KEYS,
+    BeautifulSoup,
+    UserMethods,
+)
+
+
+# The user every test looks up, and the pages fetched for them
+USER = "doublez"
+USER_URL = f"https://www.albumoftheyear.org/user/{USER}"
+USER_PERFECT_URL = f"{USER_URL}/ratings/perfect/"
+USER_LIKED_URL = f"{USER_URL}/liked/albums/"
+
+
+# Public UserMethods functions by name, resolved once for the parametrized tests
+USER_METHODS = {
+    name: function
+    for name, function in vars(UserMethods).items()
+    if name.startswith("user_") and callable(function)
+}
 
 
 @pytest.fixture
 def user():
-    return "doublez"
+    return USER
 
 
 @pytest.fixture
@@ -20,246 +43,379 @@ def user_methods_client():
 def test_user_methods_init(user_methods_client):
     """Test initialization of UserMethods."""
     assert user_methods_client is not None
-    assert user_methods_client.user == ""
-    assert user_methods_client.url == ""
     assert user_methods_client.user_url == "https://www.albumoftheyear.org/user/"
-    assert user_methods_client.user_page is None
+    assert len(user_methods_client.user_page_cache) == 0
+
+
+def test_user_methods_has_no_instance_dict(user_methods_client):
+    """Test that UserMethods uses slots instead of a per-instance __dict__."""
+    assert not hasattr(user_methods_client, "__dict__")
+    with pytest.raises(AttributeError):
+        user_methods_client.user_pgae_cache = {}
 
 
-@patch('albumoftheyearapi.user.urlopen')
+def test_user_url(user_methods_client, user):
+    """Test that user page URLs are built from the base user URL."""
+    assert user_methods_client._user_url(user) == USER_URL
+    assert user_methods_client._user_url(user, "/liked/albums/") == (
+        USER_LIKED_URL
+    )
+
+
+@patch('albumoftheyearapi.user.fetch_page')
 @patch('albumoftheyearapi.user.BeautifulSoup')
-def test_set_user_page_success(mock_bs, mock_urlopen, user_methods_client):
+def test_get_user_page_success(mock_bs, mock_fetch_page, user_methods_client):
     """Test successful fetching and parsing of a user page."""
-    mock_response = MagicMock()
-    mock_response.read.return_value = b"<html>mock html</html>"
-    mock_urlopen.return_value = mock_response
+    mock_fetch_page.return_value = b"<html>mock html</html>"
     mock_bs.return_value = "mock_beautifulsoup_object"
 
-    user = "testuser"
     url = "http://test.com"
-    user_methods_client._UserMethods__set_user_page(user, url)  # Call private method
-
-    mock_urlopen.assert_called_once()
-    mock_bs.assert_called_once_with(b"<html>mock html</html>", "html.parser")
-    assert user_methods_client.user == user
-    assert user_methods_client.url == url
-    assert user_methods_client.user_page == "mock_beautifulsoup_object"
-
-
-@patch('albumoftheyearapi.user.urlopen', side_effect=Exception("Network error"))
-def test_set_user_page_error(mock_urlopen, user_methods_client):
+    page = user_methods_client._UserMethods__get_user_page(url)  # Call private method
+
+    mock_fetch_page.assert_called_once_with("http://test.com")
+    mock_bs.assert_called_once_with(b"<html>mock html</html>", "lxml", parse_only=None)
+    assert page == "mock_beautifulsoup_object"
+    assert user_methods_client.user_page_cache[url] == "mock_beautifulsoup_object"
+
+
+@patch('albumoftheyearapi.user.fetch_page')
+def test_get_user_page_lxml_lookups(mock_fetch_page, user_methods_client, user):
+    """Test that the href and class lookups still match on a page parsed with lxml."""
+    mock_fetch_page.return_value = f"""
+    <html><body>
+        <a href="/user/{user}/ratings/"><div class="profileStat">1,234</div>Ratings</a>
+        <div class="aboutUser">Hello</div>
+    </body></html>
+    """.encode()
+
+    assert user_methods_client.user_rating_count(user) == "1,234"
+    assert user_methods_client.user_about(user) == "Hello"
+    mock_fetch_page.assert_called_once_with(USER_URL)
+
+
+@patch('albumoftheyearapi.user.fetch_page')
+def test_get_user_page_cache_switching(mock_fetch_page, user_methods_client, user):
+    """Test that alternating between a user's pages doesn't fetch them again."""
+    mock_fetch_page.side_effect = lambda url: f'<div class="aboutUser">{url}</div>'.encode()
+    profile_url = USER_URL
+
+    user_methods_client.user_about(user)
+    user_methods_client.user_perfect_scores(user)
+    user_methods_client.user_profile_cache.clear()
+    assert user_methods_client.user_about(user) == profile_url
+    user_methods_client.user_perfect_scores(user)
+    assert mock_fetch_page.call_count == 2
+
+
+@patch('albumoftheyearapi.user.USER_PAGE_CACHE_SIZE', 2)
+@patch('albumoftheyearapi.user.fetch_page', return_value=b"<html></html>")
+def test_get_user_page_cache_is_bounded(mock_fetch_page, user_methods_client):
+    """Test that the least recently used page is dropped once the cache is full."""
+    for url in ("http://test.com/1", "http://test.com/2", "http://test.com/1", "http://test.com/3"):
+        user_methods_client._UserMethods__get_user_page(url)
+
+    assert list(user_methods_client.user_page_cache) == ["http://test.com/1", "http://test.com/3"]
+    assert mock_fetch_page.call_count == 3
+
+
+@patch('albumoftheyearapi.user.fetch_page')
+def test_get_user_page_strains_album_pages(mock_fetch_page, user_methods_client, user):
+    """Test that perfect scores pages are parsed down to their album blocks."""
+    mock_fetch_page.return_value = b"""
+    <html><body>
+        <div class="header"><a href="/">Home</a></div>
+        <div class="albumBlock">
+            <div class="artistTitle">Artist X</div>
+            <div class="albumTitle">Album X</div>
+        </div>
+    </body></html>
+    """
+
+    assert user_methods_client.user_perfect_scores(user).split() == ["Artist", "X", "Album", "X"]
+    page = user_methods_client.user_page_cache[USER_PERFECT_URL]
+    assert page.find(class_="header") is None
+
+
+@patch('albumoftheyearapi.session.POOL')
+def test_user_pages_use_disk_page_cache(mock_pool, tmp_path, user):
+    """Test that a new client is served user pages from the on-disk page cache."""
+    mock_pool.request.return_value = SimpleNamespace(
+        status=200, data=b'<div class="aboutUser">Hello</div>', headers={}
+    )
+    session.enable_page_cache(str(tmp_path), max_age=3600)
+    try:
+        assert UserMethods().user_about(user) == "Hello"
+        assert UserMethods().user_about(user) == "Hello"
+    finally:
+        session.disable_page_cache()
+
+    mock_pool.request.assert_called_once()
+
+
+@patch('albumoftheyearapi.user.fetch_page', side_effect=Exception("Network error"))
+def test_get_user_page_error(mock_fetch_page, user_methods_client):
     """Test error handling during fetching a user page."""
-    user = "testuser"
-    url = "http://test.com"
     with pytest.raises(Exception, match="Network error"):
-        user_methods_client._UserMethods__set_user_page(user, url)
+        user_methods_client._UserMethods__get_user_page("http://test.com")
 
 
 # Parameterized testing for user statistics
+PROFILE_HTML = """
+<html><body>
+    <a href="/user/{user}/ratings/"><div class="profileStat">123</div>Ratings</a>
+    <a href="/user/{user}/reviews/"><div class="profileStat">45</div>Reviews</a>
+    <a href="/user/{user}/lists/"><div class="profileStat">6</div>Lists</a>
+    <a href="/user/{user}/followers/"><div class="profileStat">789</div>Followers</a>
+    <div class="aboutUser">This is a test about me section.</div>
+</body></html>
+"""
+
+
 @pytest.mark.parametrize(
-    "method_name, url_suffix, expected_text",
+    "method_name, expected_count",
     [
-        ("user_rating_count", "/ratings/", "123 Ratings"),
-        ("user_review_count", "/reviews/", "45 Reviews"),
-        ("user_list_count", "/lists/", "6 Lists"),
-        ("user_follower_count", "/followers/", "789 Followers"),
+        ("user_rating_count", "123"),
+        ("user_review_count", "45"),
+        ("user_list_count", "6"),
+        ("user_follower_count", "789"),
     ],
 )
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_statistic_success(mock_set_user_page, user_methods_client, user, method_name, url_suffix, expected_text):
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_statistic_success(mock_get_user_page, user_methods_client, user, method_name, expected_count):
     """Test successful retrieval of user statistics."""
-    mock_section = MagicMock()
-    mock_section.find.return_value.getText.return_value = expected_text.split(" ")[0]  # Return only the number
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = mock_section
+    mock_get_user_page.return_value = BeautifulSoup(PROFILE_HTML.format(user=user), "lxml")
 
-    method = getattr(user_methods_client, method_name)
-    result = method(user)
+    result = USER_METHODS[method_name](user_methods_client, user)
 
-    assert result == expected_text.split(" ")[0]
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
-    user_methods_client.user_page.find.assert_called_once()
+    assert result == expected_count
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
 
 
 @pytest.mark.parametrize(
-    "method_name, url_suffix",
-    [
-        ("user_rating_count", "/ratings/"),
-        ("user_review_count", "/reviews/"),
-        ("user_list_count", "/lists/"),
-        ("user_follower_count", "/followers/"),
-    ],
+    "method_name",
+    ["user_rating_count", "user_review_count", "user_list_count", "user_follower_count"],
 )
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_statistic_error(mock_set_user_page, user_methods_client, user, method_name, url_suffix):
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_statistic_error(mock_get_user_page, user_methods_client, user, method_name):
     """Test error handling when statistic is not found."""
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = None  # Simulate statistic not found
+    mock_get_user_page.return_value = BeautifulSoup("<html><body></body></html>", "lxml")
 
-    method = getattr(user_methods_client, method_name)
-    with pytest.raises(AttributeError):  # Expect AttributeError when getText() is called on None
-        method(user)
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
+    with pytest.raises(KeyError):  # The stat is missing from the loaded profile
+        USER_METHODS[method_name](user_methods_client, user)
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
 
 
-# Test user_about
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_about_success(mock_set_user_page, user_methods_client, user):
-    """Test successful retrieval of user 'about' information."""
-    expected_about = "This is a test about me section."
-    mock_about_section = MagicMock()
-    mock_about_section.getText.return_value = expected_about
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = mock_about_section
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_load_profile_single_pass(mock_get_user_page, user_methods_client, user):
+    """Test that every stat is read from one walk of the page and cached by username."""
+    mock_get_user_page.return_value = BeautifulSoup(PROFILE_HTML.format(user=user), "lxml")
 
-    result = user_methods_client.user_about(user)
+    profile = user_methods_client._load_profile(user)
+    assert profile == {
+        "ratings": "123",
+        "reviews": "45",
+        "lists": "6",
+        "followers": "789",
+        "about": "This is a test about me section.",
+    }
 
-    assert result == expected_about
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
-    user_methods_client.user_page.find.assert_called_once()
+    assert user_methods_client.user_review_count(user) == "45"
+    assert user_methods_client.user_about(user) == "This is a test about me section."
+    mock_get_user_page.assert_called_once()
 
 
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_about_not_found(mock_set_user_page, user_methods_client, user):
-    """Test handling when user 'about' section is not found."""
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = None  # Simulate 'about' section not found
+# Test user_about
+@pytest.mark.parametrize(
+    "html, expected_about",
+    [
+        (PROFILE_HTML, "This is a test about me section."),
+        ("<html><body></body></html>", ""),  # Expect empty string when not found
+    ],
+    ids=["success", "not_found"],
+)
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_about(mock_get_user_page, user_methods_client, user, html, expected_about):
+    """Test retrieval of user 'about' information, with and without the section."""
+    mock_get_user_page.return_value = BeautifulSoup(html.format(user=user), "lxml")
 
     result = user_methods_client.user_about(user)
 
-    assert result == ""  # Expect empty string when not found
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
+    assert result == expected_about
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
 
 
 # Test user_rating_distribution
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_rating_distribution_success(mock_set_user_page, user_methods_client, user):
+# Distribution rows shared by the tests below; get_text simulates the actual page content
+DIST_ROWS = [SimpleNamespace(get_text=lambda *args, i=i, **kwargs: f"100   {i}") for i in range(11)]
+EMPTY_DIST_ROWS = [SimpleNamespace(get_text=lambda *args, **kwargs: "")] * 11
+
+
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_rating_distribution_success(mock_get_user_page, user_methods_client, user):
     """Test successful retrieval of user rating distribution."""
-    # Mock getText to return strings that simulate the actual page content
-    # The parsing logic in user_rating_distribution will extract the number from these.
-    mock_dist_rows = [MagicMock(getText=MagicMock(return_value=f"100   {i}")) for i in range(11)]
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.findAll.return_value = mock_dist_rows
+    # The parsing logic in user_rating_distribution will extract the number from these rows.
+    mock_get_user_page.return_value = Mock(spec=BeautifulSoup)
+    mock_get_user_page.return_value.find_all.return_value = DIST_ROWS
 
     result = user_methods_client.user_rating_distribution(user)
 
     assert len(result) == 11
     assert result[0] == "0" # For "100   0" -> "0"
     assert result[10] == "10" # For "100   10" -> "10"
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
-    user_methods_client.user_page.findAll.assert_called_once()
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
+    mock_get_user_page.return_value.find_all.assert_called_once_with(class_="distRow", limit=11)
 
 
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_rating_distribution_empty(mock_set_user_page, user_methods_client, user):
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_rating_distribution_empty(mock_get_user_page, user_methods_client, user):
     """Test handling of empty rating distribution."""
-    mock_dist_rows = [MagicMock(getText=MagicMock(return_value="")) for _ in range(11)]
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.findAll.return_value = mock_dist_rows
+    mock_get_user_page.return_value = Mock(spec=BeautifulSoup)
+    mock_get_user_page.return_value.find_all.return_value = EMPTY_DIST_ROWS
 
     result = user_methods_client.user_rating_distribution(user)
 
     assert len(result) == 11
     assert all(r == "0" for r in result)  # Expect all values to be "0"
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
-
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
 
-# Test user_ratings
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_ratings_success(mock_set_user_page, user_methods_client, user):
-    """Test successful retrieval of user ratings summary."""
-    expected_ratings = "Test Album - Test Artist - 80"
-    mock_album_block = MagicMock()
-    mock_album_block.getText.return_value = expected_ratings
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = mock_album_block
 
-    result = user_methods_client.user_ratings(user)
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_rating_distribution_parsed_rows(mock_get_user_page, user_methods_client, user):
+    """Test that counts are read from the last word of real distRow markup."""
+    rows = "".join(
+        f'<div class="distRow"><div class="label">{i}0-{i}9</div>\n<div class="count">{i}</div></div>'
+        for i in range(10, -1, -1)
+    )
+    mock_get_user_page.return_value = BeautifulSoup(
+        f'<div>{rows}<div class="distRow"></div></div>', "lxml"
+    )
 
-    assert result == expected_ratings
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
-    user_methods_client.user_page.find.assert_called_once()
+    result = user_methods_client.user_rating_distribution(user)
 
+    assert result == [str(i) for i in range(10, -1, -1)]
+    mock_get_user_page.assert_called_once_with(USER_URL, PROFILE_PAGE_STRAINER)
 
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_ratings_not_found(mock_set_user_page, user_methods_client, user):
-    """Test handling when user ratings summary is not found."""
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = None  # Simulate ratings not found
 
-    result = user_methods_client.user_ratings(user)
+@patch('albumoftheyearapi.user.UserMethods.user_rating_distribution')
+def test_user_rating_distribution_json(mock_distribution, user_methods_client, user):
+    """Test that distribution counts are keyed by score range in page order."""
+    mock_distribution.return_value = [str(i) for i in range(11)]
 
-    assert result == ""  # Expect empty string when not found
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}")
+    result = json.loads(user_methods_client.user_rating_distribution_json(user))
 
+    assert list(result) == list(RATING_DISTRIBUTION_KEYS)
+    assert result["100"] == "0"
+    assert result["0-9"] == "10"
 
-# Test user_perfect_scores
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_perfect_scores_success(mock_set_user_page, user_methods_client, user):
-    """Test successful retrieval of user perfect scores."""
-    expected_scores = "Perfect Album - Perfect Artist - 100"
-    mock_album_block = MagicMock()
-    mock_album_block.getText.return_value = expected_scores
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = mock_album_block
 
-    result = user_methods_client.user_perfect_scores(user)
+# Test user_ratings and user_perfect_scores
+@pytest.mark.parametrize(
+    "method_name, url, strainer",
+    [
+        ("user_ratings", USER_URL, PROFILE_PAGE_STRAINER),
+        ("user_perfect_scores", USER_PERFECT_URL, ALBUM_BLOCK_STRAINER),
+    ],
+)
+@pytest.mark.parametrize(
+    "album_block_text",
+    ["Test Album - Test Artist - 80", None],  # None simulates no album block on the page
+    ids=["success", "not_found"],
+)
+@patch('albumoftheyearapi.user.UserMethods._UserMethods__get_user_page')
+def test_user_album_block(
+    mock_get_user_page, user_methods_client, user, method_name, url, strainer, album_block_text
+):
+    """Test that the first album block's text is returned, or an empty string when there is none."""
+    mock_get_user_page.return_value = Mock(spec=BeautifulSoup)
+    if album_block_text is None:
+        mock_get_user_page.return_value.find.return_value = None
+    else:
+        mock_get_user_page.return_value.find.return_value = SimpleNamespace(getText=lambda: album_block_text)
 
-    assert result == expected_scores
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}/ratings/perfect/")
-    user_methods_client.user_page.find.assert_called_once()
+    result = USER_METHODS[method_name](user_methods_client, user)
 
+    assert result == (album_block_text or "")
+    mock_get_user_page.assert_called_once_with(url, strainer)
+    mock_get_user_page.return_value.find.assert_called_once()
 
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_perfect_scores_not_found(mock_set_user_page, user_methods_client, user):
-    """Test handling when user perfect scores are not found."""
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find.return_value = None  # Simulate perfect scores not found
 
-    result = user_methods_client.user_perfect_scores(user)
+@patch('albumoftheyearapi.user.fetch_page')
+def test_user_perfect_scores_reads_first_block(mock_fetch_page, user_methods_client, user):
+    """Test that only the first album block of a strained page is returned."""
+    mock_fetch_page.return_value = b"""
+    <html><body>
+        <div class="header">Perfect Scores</div>
+        <div class="albumBlock small"><div class="albumTitle">First</div></div>
+        <div class="albumBlock small"><div class="albumTitle">Second</div></div>
+    </body></html>
+    """
 
-    assert result == ""  # Expect empty string when not found
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}/ratings/perfect/")
+    assert user_methods_client.user_perfect_scores(user) == "First"
 
 
 # Test user_liked_music
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_liked_music_success(mock_set_user_page, user_methods_client, user):
+@patch('albumoftheyearapi.user.fetch_page')
+def test_user_liked_music_success(mock_fetch_page, user_methods_client, user):
     """Test successful retrieval of user liked music."""
-    mock_album_block = MagicMock()
-    
-    # Configure the find method of mock_album_block to return specific mocks
-    # based on the class_ argument. This ensures getText() is always called
-    # on a MagicMock object.
-    mock_album_block.find.side_effect = lambda class_: \
-        MagicMock(getText=MagicMock(return_value="Test Artist")) if class_ == "artistTitle" else \
-        MagicMock(getText=MagicMock(return_value="Test Album")) if class_ == "albumTitle" else \
-        None # Return None if class_ doesn't match
-
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find_all.return_value = [mock_album_block]
+    mock_fetch_page.return_value = """
+    <html><body>
+        <div class="albumBlock small">
+            <a href="/artist/1/"><div class="artistTitle">Test Artist</div></a>
+            <a href="/album/1.php"><div class="albumTitle">Test Album</div></a>
+        </div>
+        <div class="albumBlock small">
+            <div class="artistTitle">Björk </div>
+            <div class="albumTitle"> Vespertine</div>
+        </div>
+        <div class="albumBlock small">
+            <div class="albumTitle">Untitled</div>
+        </div>
+    </body></html>
+    """.encode("utf-8")
 
     result = user_methods_client.user_liked_music(user)
 
-    assert len(result) == 1
-    assert result[0] == "Test Artist: Test Album"
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}/liked/albums/")
-    user_methods_client.user_page.find_all.assert_called_once()
+    assert result == ["Test Artist: Test Album", "Bjork: Vespertine", "Untitled"]
+    mock_fetch_page.assert_called_once_with(USER_LIKED_URL)
 
+    # The parsed tree is cached by URL
+    user_methods_client.user_liked_music(user)
+    mock_fetch_page.assert_called_once()
 
-@patch('albumoftheyearapi.user.UserMethods._UserMethods__set_user_page')
-def test_user_liked_music_empty(mock_set_user_page, user_methods_client, user):
-    """Test handling when user has no liked music."""
-    user_methods_client.user_page = MagicMock()
-    user_methods_client.user_page.find_all.return_value = []  # Simulate no liked music
 
+@patch('albumoftheyearapi.user.fetch_page', return_value=b"<html><body></body></html>")
+def test_user_liked_music_empty(mock_fetch_page, user_methods_client, user):
+    """Test handling when user has no liked music."""
     result = user_methods_client.user_liked_music(user)
 
     assert len(result) == 0
-    mock_set_user_page.assert_called_once_with(user, f"https://www.albumoftheyear.org/user/{user}/liked/albums/")
+    mock_fetch_page.assert_called_once_with(USER_LIKED_URL)
+
+
+@pytest.mark.parametrize("body", [b"", b"  \n "])
+@patch('albumoftheyearapi.user.fetch_page')
+def test_user_liked_music_empty_page(mock_fetch_page, user_methods_client, user, body):
+    """Test that an empty liked albums page yields no liked music."""
+    mock_fetch_page.return_value = body
+
+    assert user_methods_client.user_liked_music(user) == []
+    mock_fetch_page.assert_called_once_with(USER_LIKED_URL)
 
 
 # Test JSON serialization methods
+# Return values of the methods each *_json method serializes
+JSON_SOURCE_VALUES = {
+    "user_rating_count": "100",
+    "user_review_count": "50",
+    "user_list_count": "10",
+    "user_follower_count": "200",
+    "user_about": "About me",
+    "user_ratings": "Some ratings",
+    "user_perfect_scores": "Perfect scores",
+    "user_liked_music": ["Liked music"],
+}
+
+
 @pytest.mark.parametrize(
     "method_name, expected_key",
     [
@@ -273,55 +429,16 @@ def test_user_liked_music_empty(mock_set_user_page, user_methods_client, user):
         ("user_liked_music_json", "liked music"),
     ],
 )
-@patch('albumoftheyearapi.user.UserMethods.user_rating_count')
-@patch('albumoftheyearapi.user.UserMethods.user_review_count')
-@patch('albumoftheyearapi.user.UserMethods.user_list_count')
-@patch('albumoftheyearapi.user.UserMethods.user_follower_count')
-@patch('albumoftheyearapi.user.UserMethods.user_about')
-@patch('albumoftheyearapi.user.UserMethods.user_ratings')
-@patch('albumoftheyearapi.user.UserMethods.user_perfect_scores')
-@patch('albumoftheyearapi.user.UserMethods.user_liked_music')
-def test_json_serialization_success(
-    mock_liked_music,
-    mock_perfect_scores,
-    mock_ratings,
-    mock_about,
-    mock_follower_count,
-    mock_list_count,
-    mock_review_count,
-    mock_rating_count,
-    user_methods_client,
-    user,
-    method_name,
-    expected_key,
-):
+def test_json_serialization_success(user_methods_client, user, method_name, expected_key):
     """Test successful JSON serialization of user data."""
-    # Set return values for each mock
-    mock_rating_count.return_value = "100"
-    mock_review_count.return_value = "50"
-    mock_list_count.return_value = "10"
-    mock_follower_count.return_value = "200"
-    mock_about.return_value = "About me"
-    mock_ratings.return_value = "Some ratings"
-    mock_perfect_scores.return_value = "Perfect scores"
-    mock_liked_music.return_value = ["Liked music"]
-
-    method = getattr(user_methods_client, method_name)
-    result_json = method(user)
+    with patch.multiple(
+        'albumoftheyearapi.user.UserMethods', **dict.fromkeys(JSON_SOURCE_VALUES, DEFAULT)
+    ) as mocks:
+        for source_name, value in JSON_SOURCE_VALUES.items():
+            mocks[source_name].return_value = value
+
+        result_json = USER_METHODS[method_name](user_methods_client, user)
     result = json.loads(result_json)
 
     assert expected_key in result
-    
-    # Map method_name to its expected return value for cleaner assertions
-    expected_values_map = {
-        "user_rating_count_json": "100",
-        "user_review_count_json": "50",
-        "user_list_count_json": "10",
-        "user_follower_count_json": "200",
-        "user_about_json": "About me",
-        "user_ratings_json": "Some ratings",
-        "user_perfect_scores_json": "Perfect scores",
-        "user_liked_music_json": ["Liked music"],
-    }
-    assert result[expected_key] == expected_values_map[method_name]
-
+    assert result[expected_key] == JSON_SOURCE_VALUES[method_name.removesuffix("_json")]
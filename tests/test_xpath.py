@@ -0,0 +1,20 @@
+import pytest
+from lxml import etree
+
+from albumoftheyearapi.xpath import class_xpath
+
+
+@pytest.mark.parametrize(
+    "class_attribute, matches",
+    [
+        ("artistTitle", True),
+        ("artistTitle small", True),
+        ("  small\tartistTitle ", True),
+        ("artistTitleLink", False),
+        ("", False),
+    ],
+)
+def test_class_xpath_matches_class_words(class_attribute, matches):
+    """Test that the predicate matches a whole class word, like a CSS class selector."""
+    root = etree.fromstring(f'<div><p class="{class_attribute}"/></div>')
+    assert bool(root.xpath(".//p" + class_xpath("artistTitle"))) is matches